@@ -0,0 +1,130 @@
+"""
+Benchmark how many bytes the main loop pushes to the display per frame.
+Plays short scripted sessions in each scene through main.run with idle
+waiting off, counting the area passed to pygame.display.update (dirty
+rectangles) and pygame.display.flip (the whole screen), and compares
+that with flipping the full screen every frame.
+Runs headless with SDL's dummy drivers in a scratch directory, so the
+real save file is never touched.
+
+Usage: python benchmark_display_updates.py [frames per action]
+"""
+
+import os
+import sys
+import tempfile
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from main import run
+from game.game_manager import GameManager
+
+class DisplayCounter:
+    """Wraps pygame.display.update and flip to count the pixels they push"""
+
+    def __init__(self, screen):
+        self.screen_rect = screen.get_rect()
+        self.pixels = 0
+        self.update = pygame.display.update
+        self.flip = pygame.display.flip
+        pygame.display.update = self.counted_update
+        pygame.display.flip = self.counted_flip
+
+    def counted_update(self, rects):
+        for rect in rects:
+            visible = self.screen_rect.clip(rect)
+            self.pixels += visible.width * visible.height
+        self.update(rects)
+
+    def counted_flip(self):
+        self.pixels += self.screen_rect.width * self.screen_rect.height
+        self.flip()
+
+    def restore(self):
+        pygame.display.update = self.update
+        pygame.display.flip = self.flip
+
+def run_frames(game, screen, frames, events=()):
+    """Post events, then run the main loop for about the given number of frames"""
+    for event in events:
+        pygame.event.post(event)
+    run(game, screen, idle_wait=False, duration=frames * 1000 // 60)
+
+def key(char):
+    """A key press typing char"""
+    return pygame.event.Event(pygame.KEYDOWN, key=0, unicode=char, mod=0, scancode=0)
+
+def journal_reading(game, screen, frames):
+    game.change_scene('journal')
+    run_frames(game, screen, frames * 10)
+
+def journal_typing(game, screen, frames):
+    game.change_scene('journal')
+    game.scenes['journal'].journal_input.active = True
+    for char in "Today I finally understood recursion.":
+        run_frames(game, screen, frames, [key(char)])
+    game.scenes['journal'].journal_input.active = False
+
+def journal_scrolling(game, screen, frames):
+    game.change_scene('journal')
+    pos = game.scenes['journal'].entries_panel.rect.center
+    for button in (5, 5, 5, 4, 4, 4) * 2:
+        run_frames(game, screen, frames, [pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=button, pos=pos)])
+
+def journal_hovering(game, screen, frames):
+    game.change_scene('journal')
+    scene = game.scenes['journal']
+    for button in (scene.save_button, scene.prompt_button, scene.back_button) * 3:
+        for pos in (button.rect.center, scene.entries_panel.rect.center):
+            pygame.mouse.set_pos(pos)
+            motion = pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0))
+            run_frames(game, screen, frames, [motion])
+
+def affirmation_steps(game, screen, frames):
+    game.change_scene('affirmation')
+    scene = game.scenes['affirmation']
+    for _ in range(4):
+        if scene.current_step == 2:
+            scene.select_option(0)
+        scene.next_step()
+        run_frames(game, screen, frames * 3)
+
+def main_scene(game, screen, frames):
+    game.change_scene('main')
+    run_frames(game, screen, frames * 10)
+
+def run_benchmark(frames):
+    pygame.init()
+    screen = pygame.display.set_mode((1280, 720))
+    game = GameManager(screen)
+    for i in range(40):
+        game.player_data.add_journal_entry(f"Entry {i}: a small step forward today.")
+    pygame.event.clear()
+
+    full_frame = screen.get_width() * screen.get_height() * screen.get_bytesize()
+    print(f"\nBytes pushed to the display per frame (full frame is {full_frame:,} bytes)")
+    print(f"  {'session':<20}{'frames':>8}{'bytes/frame':>14}{'of full':>10}")
+    for label, session in (('journal reading', journal_reading),
+                           ('journal typing', journal_typing),
+                           ('journal scrolling', journal_scrolling),
+                           ('journal hovering', journal_hovering),
+                           ('affirmation steps', affirmation_steps),
+                           ('main scene', main_scene)):
+        counter = DisplayCounter(screen)
+        frame_count = game.frame_clock.frame_count
+        session(game, screen, frames)
+        counter.restore()
+        frame_count = game.frame_clock.frame_count - frame_count
+        per_frame = counter.pixels * screen.get_bytesize() / frame_count
+        print(f"  {label:<20}{frame_count:>8}{per_frame:>14,.0f}{per_frame / full_frame:>10.1%}")
+
+    game.shutdown()
+    pygame.quit()
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as scratch:
+        os.chdir(scratch)
+        run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 6)
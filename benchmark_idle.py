@@ -0,0 +1,93 @@
+"""
+Benchmark CPU usage of the main loop with and without idle waiting.
+Runs main.run for a few seconds in each scene, first redrawing at 60 FPS
+every frame and then with idle_wait, and reports CPU time per second of
+wall time and frames drawn. Also measures how quickly an idle loop wakes
+up when input arrives.
+Runs headless with SDL's dummy drivers in a scratch directory, so the
+real save file is never touched.
+
+Usage: python benchmark_idle.py [seconds]
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from main import run
+from game.game_manager import GameManager
+
+WAKE_EVENT = pygame.USEREVENT + 1
+
+def measure(game, screen, scene, idle_wait, seconds, typing=False):
+    """Run the loop in a scene; returns (CPU percent, frames per second)"""
+    game.change_scene(scene)
+    game.scenes['journal'].journal_input.active = typing
+    frames = game.frame_clock.frame_count
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    run(game, screen, idle_wait=idle_wait, duration=seconds * 1000)
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+    return cpu / wall * 100, (game.frame_clock.frame_count - frames) / wall
+
+def post_wake_events(count, interval):
+    """Post timestamped events from another thread, like input arriving"""
+    for _ in range(count):
+        time.sleep(interval)
+        pygame.event.post(pygame.event.Event(WAKE_EVENT, posted=time.perf_counter()))
+
+def measure_wake_latency(game, screen, count=10, interval=0.2):
+    """Milliseconds from an event being posted to the idle loop handling it"""
+    latencies = []
+    handle_event = game.handle_event
+    
+    def record(event):
+        if event.type == WAKE_EVENT:
+            latencies.append((time.perf_counter() - event.posted) * 1000)
+        handle_event(event)
+        
+    game.handle_event = record
+    game.change_scene('journal')
+    game.scenes['journal'].journal_input.active = False
+    poster = threading.Thread(target=post_wake_events, args=(count, interval))
+    poster.start()
+    run(game, screen, idle_wait=True, duration=(count + 1) * interval * 1000)
+    poster.join()
+    game.handle_event = handle_event
+    return latencies
+
+def run_benchmark(seconds):
+    pygame.init()
+    screen = pygame.display.set_mode((1280, 720))
+    game = GameManager(screen)
+    pygame.event.clear()
+    
+    print(f"\nMain loop CPU usage, {seconds:g} s per run")
+    print(f"  {'scene':<18}{'60 FPS cpu':>12}{'fps':>8}{'idle cpu':>12}{'fps':>8}")
+    for label, scene, typing in (('main', 'main', False),
+                                 ('journal reading', 'journal', False),
+                                 ('journal typing', 'journal', True),
+                                 ('affirmation', 'affirmation', False)):
+        busy_cpu, busy_fps = measure(game, screen, scene, False, seconds, typing)
+        idle_cpu, idle_fps = measure(game, screen, scene, True, seconds, typing)
+        print(f"  {label:<18}{busy_cpu:>11.1f}%{busy_fps:>8.1f}{idle_cpu:>11.1f}%{idle_fps:>8.1f}")
+        
+    latencies = measure_wake_latency(game, screen)
+    print(f"\nIdle wake-up on input: average {sum(latencies) / len(latencies):.2f} ms, "
+          f"worst {max(latencies):.2f} ms over {len(latencies)} events")
+    
+    game.shutdown()
+    pygame.quit()
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as scratch:
+        os.chdir(scratch)
+        run_benchmark(float(sys.argv[1]) if len(sys.argv) > 1 else 3)
@@ -0,0 +1,116 @@
+"""
+Benchmark per-frame PlantRenderer drawing.
+Compares drawing the pot and soil directly every frame against blitting
+the cached static layer, full plant frames drawn directly against frames
+served from the sprite cache, and the NumPy particle system against the
+original list-of-dicts particles.
+Runs headless with SDL's dummy video driver.
+
+Usage: python benchmark_plant_renderer.py [frames]
+"""
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+from game.plant_renderer import PlantRenderer
+from game.particles import ParticleSystem
+
+SCREEN_SIZE = (1280, 720)
+BACKGROUND = (62, 88, 156)
+
+def time_frames(draw, surface, frames):
+    """Average time of one call to draw(surface), in microseconds"""
+    start = time.perf_counter()
+    for _ in range(frames):
+        draw(surface)
+    return (time.perf_counter() - start) / frames * 1000000
+
+def make_dict_particles(count):
+    """Particles the way PlantRenderer stored them before ParticleSystem"""
+    return [{
+        'x': random.uniform(0, SCREEN_SIZE[0]),
+        'y': random.uniform(0, SCREEN_SIZE[1]),
+        'speed': random.uniform(0.1, 0.3),
+        'size': random.randint(2, 5),
+        'life': random.uniform(0.5, 1.0)
+    } for _ in range(count)]
+
+def dict_particles_frame(particles, surface, dt=16):
+    """One update and draw of the original per-particle loop"""
+    for particle in particles:
+        particle['y'] += particle['speed'] * dt
+        particle['life'] -= dt * 0.0005
+    for particle in particles:
+        alpha = max(0, int(255 * particle['life']))
+        pygame.draw.circle(surface, (100, 150, 255, alpha),
+                           (int(particle['x']), int(particle['y']) % SCREEN_SIZE[1]),
+                           int(particle['size']))
+
+def benchmark_particles(surface, frames):
+    print("\nParticles, update + draw per frame")
+    print(f"  {'count':<8}{'dicts us':>12}{'numpy us':>12}")
+    for count in (20, 1000, 10000, 50000):
+        particles = make_dict_particles(count)
+        dict_us = time_frames(lambda s: dict_particles_frame(particles, s), surface, max(1, frames // 20))
+
+        system = ParticleSystem(surface.get_rect(), (100, 150, 255), life_decay=0)
+        def numpy_frame(s):
+            if len(system) < count:
+                system.emit_random(count - len(system), (0, SCREEN_SIZE[0]), (0, SCREEN_SIZE[1]),
+                                   (0.1, 0.3), (2, 5), (0.5, 1.0))
+            system.update(16)
+            system.draw(s)
+        numpy_us = time_frames(numpy_frame, surface, max(1, frames // 20))
+        print(f"  {count:<8}{dict_us:>12.1f}{numpy_us:>12.1f}")
+
+def run_benchmark(frames):
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN_SIZE)
+    renderer = PlantRenderer(screen.get_rect())
+    center_x = renderer.screen_rect.centerx
+    base_y = renderer.screen_rect.centery + renderer.pot_height // 2
+
+    # The cached layer must look exactly like drawing directly
+    direct = pygame.Surface(SCREEN_SIZE)
+    cached = pygame.Surface(SCREEN_SIZE)
+    direct.fill(BACKGROUND)
+    cached.fill(BACKGROUND)
+    renderer._draw_static(direct, center_x, base_y)
+    renderer.draw(cached, 1, 0.0)
+    assert pygame.image.tostring(direct, 'RGB') == pygame.image.tostring(cached, 'RGB')
+
+    surface = pygame.Surface(SCREEN_SIZE)
+    surface.fill(BACKGROUND)
+
+    print(f"\nPot and soil, average of {frames} frames")
+    before = time_frames(lambda s: renderer._draw_static(s, center_x, base_y), surface, frames)
+    after = time_frames(lambda s: s.blit(renderer.static_layer, renderer.static_layer_pos), surface, frames)
+    print(f"  {'direct draw':<18}{before:>10.1f} us")
+    print(f"  {'cached layer':<18}{after:>10.1f} us  ({before / after:.1f}x faster)")
+
+    print("\nFull plant frame")
+    print(f"  {'level':<8}{'direct us':>12}{'cached us':>12}{'hit rate':>10}")
+    direct_renderer = PlantRenderer(screen.get_rect(), sprite_cache_size=0)
+    for level in (1, 5, 10):
+        def draw_frame(renderer, s):
+            renderer.update(16)
+            renderer.draw(s, level, 0.5)
+
+        renderer.sprite_cache_hits = renderer.sprite_cache_misses = 0
+        direct_us = time_frames(lambda s: draw_frame(direct_renderer, s), surface, frames)
+        cached_us = time_frames(lambda s: draw_frame(renderer, s), surface, frames)
+        hit_rate = renderer.sprite_cache_hits / (renderer.sprite_cache_hits + renderer.sprite_cache_misses)
+        print(f"  {level:<8}{direct_us:>12.1f}{cached_us:>12.1f}{hit_rate:>10.1%}")
+
+    benchmark_particles(surface, frames)
+
+    pygame.quit()
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
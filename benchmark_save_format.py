@@ -0,0 +1,93 @@
+"""
+Benchmark the binary save format against JSON.
+Builds player profiles with 10, 10k and 1M journal entries and compares
+save time, load time and file size for the original indent=2 JSON,
+compact JSON and the binary format in game/save_format.py.
+
+Usage: python benchmark_save_format.py [entry counts...]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+from game.save_format import encode_save, decode_save
+
+def make_profile(num_entries):
+    """Build a save dict with the given number of journal entries"""
+    return {
+        'plant_level': 7,
+        'plant_growth': 0.45,
+        'watered_today': True,
+        'affirmation_done_today': False,
+        'journal_entries': [
+            {
+                'ts': 1704067200 + i * 3600,
+                'text': f"Entry {i}: today I learned something new and felt a bit more confident."
+            }
+            for i in range(num_entries)
+        ],
+        'unlocked_messages': ["You're at the beginning of an amazing journey!"] * 7,
+        'last_login': '2024-06-01'
+    }
+
+def json_indent_save(path, data):
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+
+def json_compact_save(path, data):
+    with open(path, 'w') as f:
+        json.dump(data, f, separators=(',', ':'))
+
+def json_load(path):
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def binary_save(path, data):
+    with open(path, 'wb') as f:
+        f.write(encode_save(data))
+
+def binary_load(path):
+    with open(path, 'rb') as f:
+        return decode_save(f.read())
+
+FORMATS = [
+    ('json (indent=2)', json_indent_save, json_load),
+    ('json (compact)', json_compact_save, json_load),
+    ('binary', binary_save, binary_load),
+]
+
+def time_call(func, *args, repeat=3):
+    """Best wall time of a few runs, in milliseconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def run_benchmark(sizes):
+    with tempfile.TemporaryDirectory() as tmp:
+        for num_entries in sizes:
+            data = make_profile(num_entries)
+            repeat = 1 if num_entries >= 1000000 else 3
+            print(f"\n{num_entries} journal entries")
+            print(f"  {'format':<18}{'save ms':>12}{'load ms':>12}{'size KB':>12}")
+            
+            for name, save, load in FORMATS:
+                path = os.path.join(tmp, 'save.bench')
+                save_ms = time_call(save, path, data, repeat=repeat)
+                load_ms = time_call(load, path, repeat=repeat)
+                size_kb = os.path.getsize(path) / 1024
+                
+                # Make sure the round trip is lossless
+                loaded = load(path)
+                assert loaded['journal_entries'] == data['journal_entries']
+                
+                print(f"  {name:<18}{save_ms:>12.2f}{load_ms:>12.2f}{size_kb:>12.1f}")
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10, 10000, 1000000]
+    run_benchmark(sizes)
@@ -0,0 +1,68 @@
+"""
+Benchmark text rendering and measurement.
+Times pygame's FreeType font.render and font.size for strings seen for
+the first time (cache misses), and the cost of a hit in the shared text
+cache.
+Uses the game's font sizes (36, 24 and 16).
+
+Usage: python benchmark_text_render.py [strings]
+"""
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+from game.text_cache import CachedFont, TextRenderCache
+
+WORDS = ("today I learned something new and felt a bit more confident about "
+         "recursion, loops, classes: small steps still count! (really)").split()
+
+def load_font(size):
+    """The game font at size, or pygame's default font if it is missing"""
+    try:
+        font = pygame.font.Font('assets/fonts/minecraft.ttf', size)
+        font.render("A", True, (0, 0, 0))  # A placeholder file only fails once used
+        return font
+    except (FileNotFoundError, pygame.error):
+        return pygame.font.Font(None, size)
+
+def make_strings(count):
+    """Random journal-like lines of 1 to 12 words"""
+    rng = random.Random(1)
+    return [' '.join(rng.choice(WORDS) for _ in range(rng.randint(1, 12))) for _ in range(count)]
+
+def time_calls(func, strings):
+    """Average time of one func(text) call, in microseconds"""
+    start = time.perf_counter()
+    for text in strings:
+        func(text)
+    return (time.perf_counter() - start) / len(strings) * 1000000
+
+def run_benchmark(count):
+    pygame.init()
+    strings = make_strings(count)
+    color = (50, 50, 50)
+    
+    print(f"\nText rendering, average of {count} different strings")
+    print(f"  {'size':<6}{'render us':>11}{'size us':>10}{'cache hit us':>14}")
+    for size in (36, 24, 16):
+        font = load_font(size)
+        
+        render_us = time_calls(lambda text: font.render(text, True, color), strings)
+        size_us = time_calls(font.size, strings)
+        
+        cached = CachedFont(font, TextRenderCache(count, max_bytes=1024 * 1024 * 1024))
+        time_calls(lambda text: cached.render(text, True, color), strings)
+        hit_us = time_calls(lambda text: cached.render(text, True, color), strings)
+        
+        print(f"  {size:<6}{render_us:>11.1f}{size_us:>10.2f}{hit_us:>14.2f}")
+              
+    pygame.quit()
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
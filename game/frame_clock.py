@@ -0,0 +1,32 @@
+class FrameClock:
+    """Tracks real frame time, fed each frame with pygame's clock.tick() result.
+    
+    With fixed_step (in ms) set, frame time is accumulated and handed out in
+    equal steps, so simulation behaves identically at any frame rate.
+    """
+    
+    def __init__(self, fixed_step=None, max_dt=1000, max_steps=5):
+        self.fixed_step = fixed_step
+        self.max_dt = max_dt  # Clamp long stalls (window drags, breakpoints); idle waits stay under it
+        self.max_steps = max_steps  # Most fixed steps run in one frame
+        self.dt = 0
+        self.elapsed = 0
+        self.frame_count = 0
+        self.accumulator = 0
+    
+    def tick(self, dt):
+        """Record the milliseconds since the previous frame"""
+        self.dt = min(max(dt, 0), self.max_dt)
+        self.elapsed += self.dt
+        self.frame_count += 1
+        self.accumulator += self.dt
+    
+    def steps(self):
+        """Time steps (ms) to simulate this frame: one real dt, or any due fixed steps"""
+        if not self.fixed_step:
+            self.accumulator = 0
+            return [self.dt]
+            
+        count = min(int(self.accumulator // self.fixed_step), self.max_steps)
+        self.accumulator = min(self.accumulator - count * self.fixed_step, self.fixed_step)
+        return [self.fixed_step] * count
@@ -4,16 +4,23 @@ from .scenes.main_scene import MainScene
 from .scenes.journal_scene import JournalScene
 from .scenes.affirmation_scene import AffirmationScene
 from .player_data import PlayerData
+from .frame_clock import FrameClock
+from .text_cache import CachedFont
 
 class GameManager:
     """Main game manager that handles scene transitions and overall game state"""
     
-    def __init__(self, screen):
+    IDLE_WAIT = 1000  # Longest idle sleep (ms), so the daily reset is still checked
+    
+    def __init__(self, screen, fixed_step=None, backend='json'):
         self.screen = screen
         self.screen_rect = screen.get_rect()
         
-        # Initialize player data
-        self.player_data = PlayerData()
+        # Frame timing; pass fixed_step (ms) to update scenes in equal steps
+        self.frame_clock = FrameClock(fixed_step)
+        
+        # Initialize player data ('json' file save or 'sqlite' database)
+        self.player_data = PlayerData(backend)
         
         # Load fonts
         pygame.font.init()
@@ -28,6 +35,11 @@ class GameManager:
             self.title_font = pygame.font.SysFont('Arial', 36)
             self.main_font = pygame.font.SysFont('Arial', 24)
             self.small_font = pygame.font.SysFont('Arial', 16)
+            
+        # Rendered text is shared through one LRU cache (see game/text_cache.py)
+        self.title_font = CachedFont(self.title_font)
+        self.main_font = CachedFont(self.main_font)
+        self.small_font = CachedFont(self.small_font)
         
         # Set up scenes
         self.scenes = {
@@ -37,6 +49,9 @@ class GameManager:
         }
         self.current_scene = 'main'
         
+        # Push the whole screen on the next frame (first frame, scene change, window exposed)
+        self.full_redraw = True
+        
         # Track time for daily activities
         self.last_day = time.localtime().tm_yday
         self.check_daily_reset()
@@ -60,6 +75,7 @@ class GameManager:
         if scene_name in self.scenes:
             self.current_scene = scene_name
             self.scenes[scene_name].reset()
+            self.full_redraw = True
             
     def check_daily_reset(self):
         """Check if a day has passed to reset daily activities"""
@@ -68,15 +84,38 @@ class GameManager:
             self.player_data.reset_daily()
             self.last_day = current_day
     
+    def shutdown(self):
+        """Flush any pending saves before the game exits"""
+        self.player_data.close()
+    
     def handle_event(self, event):
         """Pass events to the current scene"""
+        if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED):
+            self.full_redraw = True
         self.scenes[self.current_scene].handle_event(event)
     
-    def update(self):
-        """Update the current scene"""
+    def idle_timeout(self):
+        """Milliseconds the main loop may wait for input before the next frame (0: animating)"""
+        timeout = self.scenes[self.current_scene].idle_timeout()
+        if timeout is None:
+            return self.IDLE_WAIT
+        return min(int(timeout), self.IDLE_WAIT)
+    
+    def update(self, dt):
+        """Update the current scene by dt, the milliseconds since the last frame"""
         self.check_daily_reset()
-        self.scenes[self.current_scene].update()
+        self.frame_clock.tick(dt)
+        for step in self.frame_clock.steps():
+            self.scenes[self.current_scene].update(step)
     
     def draw(self):
         """Draw the current scene"""
         self.scenes[self.current_scene].draw(self.screen)
+
+    def dirty_rects(self):
+        """Screen areas changed by the last draw(), or None to push the whole screen"""
+        rects = self.scenes[self.current_scene].dirty_rects()
+        if self.full_redraw:
+            self.full_redraw = False
+            return None
+        return rects
@@ -0,0 +1,75 @@
+import bisect
+import datetime
+
+def entry_day(entry):
+    """Local calendar day of an entry as a proleptic ordinal (days since 0001-01-01)"""
+    return timestamp_day(entry.timestamp)
+
+def timestamp_day(timestamp):
+    """Local calendar day of an epoch timestamp as an ordinal"""
+    return datetime.date.fromtimestamp(timestamp).toordinal()
+
+def day_start(day):
+    """Epoch timestamp of local midnight at the start of an ordinal day"""
+    return int(datetime.datetime.combine(datetime.date.fromordinal(day), datetime.time()).timestamp())
+
+def period_bounds(year, month=None, day=None):
+    """First day and the day after the last day of a year, month or day, as ordinals"""
+    if day is not None:
+        start = datetime.date(year, month, day)
+        end = start + datetime.timedelta(days=1)
+    elif month is not None:
+        start = datetime.date(year, month, 1)
+        end = datetime.date(year + month // 12, month % 12 + 1, 1)
+    else:
+        start = datetime.date(year, 1, 1)
+        end = datetime.date(year + 1, 1, 1)
+    return start.toordinal(), end.toordinal()
+
+class JournalDateIndex:
+    """Sorted index of journal entries by day, for O(log n) date seeking.
+
+    days holds the day of every entry in sorted order and positions the
+    matching index into the journal's entry list. Entries are normally
+    appended in time order, so keeping the index current is an append.
+    """
+
+    def __init__(self):
+        self.days = []
+        self.positions = []
+        self.size = 0  # Number of leading journal entries already indexed
+
+    def update(self, entries):
+        """Index any entries past the ones already indexed"""
+        for position in range(self.size, len(entries)):
+            day = entry_day(entries[position])
+            if not self.days or day >= self.days[-1]:
+                self.days.append(day)
+                self.positions.append(position)
+            else:
+                # Out of order (e.g. the clock moved back); keep the lists sorted
+                i = bisect.bisect_right(self.days, day)
+                self.days.insert(i, day)
+                self.positions.insert(i, position)
+        self.size = len(entries)
+
+    def count_between(self, start_day, end_day):
+        """Number of entries on days in [start_day, end_day)"""
+        return bisect.bisect_left(self.days, end_day) - bisect.bisect_left(self.days, start_day)
+
+    def first_position(self, start_day):
+        """Position of the earliest entry on or after start_day (the last entry if none)"""
+        if not self.days:
+            return None
+        i = min(bisect.bisect_left(self.days, start_day), len(self.days) - 1)
+        return self.positions[i]
+
+    def next_day(self, day):
+        """The first day after day that has entries, or None"""
+        i = bisect.bisect_right(self.days, day)
+        return self.days[i] if i < len(self.days) else None
+
+    def previous_day(self, day):
+        """The last day before day that has entries, or None"""
+        i = bisect.bisect_left(self.days, day)
+        return self.days[i - 1] if i > 0 else None
@@ -0,0 +1,53 @@
+import datetime
+
+class JournalEntry:
+    """A single journal entry: an epoch timestamp plus the entry text.
+    
+    Entries are kept in large numbers, so they use __slots__ and only store
+    the integer timestamp; the display date string is produced on demand.
+    """
+    
+    __slots__ = ('timestamp', 'text')
+    
+    DATE_FORMAT = "%Y-%m-%d %H:%M"
+    
+    def __init__(self, timestamp, text):
+        self.timestamp = int(timestamp)
+        self.text = text
+    
+    @classmethod
+    def now(cls, text):
+        """Create an entry stamped with the current time"""
+        return cls(datetime.datetime.now().timestamp(), text)
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Build an entry from a stored record ({'ts', 'text'}, or the older {'date', 'text'})"""
+        if 'ts' in data:
+            return cls(data['ts'], data['text'])
+        return cls(parse_date(data['date']), data['text'])
+    
+    def to_dict(self):
+        return {'ts': self.timestamp, 'text': self.text}
+    
+    @property
+    def date(self):
+        """Local date string for display, e.g. '2024-05-01 18:30'"""
+        return datetime.datetime.fromtimestamp(self.timestamp).strftime(self.DATE_FORMAT)
+    
+    def __eq__(self, other):
+        if not isinstance(other, JournalEntry):
+            return NotImplemented
+        return self.timestamp == other.timestamp and self.text == other.text
+    
+    def __lt__(self, other):
+        if not isinstance(other, JournalEntry):
+            return NotImplemented
+        return self.timestamp < other.timestamp
+    
+    def __repr__(self):
+        return f"JournalEntry({self.timestamp!r}, {self.text!r})"
+
+def parse_date(date_string):
+    """Convert a stored 'YYYY-mm-dd HH:MM' local date string to an epoch timestamp"""
+    return int(datetime.datetime.strptime(date_string, JournalEntry.DATE_FORMAT).timestamp())
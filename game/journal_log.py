@@ -0,0 +1,208 @@
+import json
+import os
+import struct
+import threading
+import time
+from .journal_entry import JournalEntry
+
+class JournalLog:
+    """Append-only journal storage with an offset index.
+
+    Every JournalEntry is written as one compact JSON record per line to
+    the log file. The index file holds the byte offset of each record as a
+    fixed-size integer, so adding an entry is a single append to each file
+    and any entry can be read back without scanning the whole log.
+
+    With a SaveWriter, appends are fsynced on its thread (one fsync per
+    file for a burst of appends) instead of on the caller's.
+    """
+
+    OFFSET_FORMAT = '<Q'
+    OFFSET_SIZE = struct.calcsize(OFFSET_FORMAT)
+
+    # Records parsed between GIL hand-offs when loading in the background
+    LOAD_CHUNK = 500
+    
+    def __init__(self, log_file='journal_log.jsonl', index_file='journal_log.idx', writer=None):
+        self.log_file = log_file
+        self.index_file = index_file
+        self.writer = writer
+        self.count = 0
+        self._entries = None
+        self._loader = None
+        # Entries appended while the background loader is still running
+        self._appended = []
+        self._lock = threading.Lock()
+        self._recover()
+
+    def __len__(self):
+        return self.count
+
+    def _recover(self):
+        """Bring the log and index back in sync after an interrupted append"""
+        if not os.path.exists(self.log_file):
+            self.count = 0
+            if os.path.exists(self.index_file):
+                os.remove(self.index_file)
+            return
+
+        # Drop a partially written last record
+        log_size = os.path.getsize(self.log_file)
+        if log_size:
+            with open(self.log_file, 'rb+') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    f.seek(0)
+                    log_size = f.read().rfind(b'\n') + 1
+                    f.truncate(log_size)
+
+        index_size = os.path.getsize(self.index_file) if os.path.exists(self.index_file) else 0
+        self.count = index_size // self.OFFSET_SIZE
+
+        # The index is valid when its last offset points at the last record
+        if self.count and index_size % self.OFFSET_SIZE == 0:
+            last_offset = self._read_offset(self.count - 1)
+            with open(self.log_file, 'rb') as f:
+                f.seek(last_offset)
+                f.readline()
+                if f.tell() == log_size:
+                    return
+        elif not self.count and not log_size:
+            return
+
+        self.rebuild_index()
+
+    def rebuild_index(self):
+        """Rebuild the offset index by scanning the log once"""
+        offsets = []
+        with open(self.log_file, 'rb') as f:
+            offset = 0
+            for line in f:
+                offsets.append(offset)
+                offset += len(line)
+
+        with open(self.index_file, 'wb') as f:
+            f.write(b''.join(struct.pack(self.OFFSET_FORMAT, o) for o in offsets))
+        self.count = len(offsets)
+
+    def _read_offset(self, index):
+        with open(self.index_file, 'rb') as f:
+            f.seek(index * self.OFFSET_SIZE)
+            return struct.unpack(self.OFFSET_FORMAT, f.read(self.OFFSET_SIZE))[0]
+
+    def append(self, entry):
+        """Append a single entry to the log"""
+        self.extend([entry])
+
+    def extend(self, entries):
+        """Append several entries with one write to each file, synced to disk (by the writer, if any)"""
+        records = []
+        offsets = []
+        with open(self.log_file, 'ab') as f:
+            offset = f.tell()
+            for entry in entries:
+                record = (json.dumps(entry.to_dict(), separators=(',', ':')) + '\n').encode('utf-8')
+                records.append(record)
+                offsets.append(struct.pack(self.OFFSET_FORMAT, offset))
+                offset += len(record)
+            f.write(b''.join(records))
+            f.flush()
+            if self.writer is None:
+                os.fsync(f.fileno())
+        with open(self.index_file, 'ab') as f:
+            f.write(b''.join(offsets))
+            f.flush()
+            if self.writer is None:
+                os.fsync(f.fileno())
+        if self.writer is not None:
+            self.writer.sync(self.log_file)
+            self.writer.sync(self.index_file)
+
+        self.count += len(records)
+        
+        # Keep the in-memory copy in step, queueing the entries for the
+        # loader to pick up rather than waiting for it to finish
+        with self._lock:
+            if self._entries is not None:
+                self._entries.extend(entries)
+            elif self._loader is not None:
+                self._appended.extend(entries)
+
+    def read(self, index):
+        """Read the entry at the given position"""
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("journal log index out of range")
+
+        with open(self.log_file, 'rb') as f:
+            f.seek(self._read_offset(index))
+            return JournalEntry.from_dict(json.loads(f.readline()))
+
+    def read_range(self, start, stop):
+        """Read the entries in [start, stop) using a single seek"""
+        start = max(0, start)
+        stop = min(self.count, stop)
+        if start >= stop:
+            return []
+
+        entries = []
+        with open(self.log_file, 'rb') as f:
+            f.seek(self._read_offset(start))
+            for _ in range(stop - start):
+                entries.append(JournalEntry.from_dict(json.loads(f.readline())))
+        return entries
+
+    def read_all(self):
+        """Read every entry in the log, oldest first"""
+        if not self.count:
+            return []
+
+        with open(self.log_file, 'rb') as f:
+            return [JournalEntry.from_dict(json.loads(line)) for line in f]
+    
+    @staticmethod
+    def read_file(log_file):
+        """Read every complete record from a log file without opening it for writing"""
+        if not os.path.exists(log_file):
+            return []
+            
+        with open(log_file, 'rb') as f:
+            # A partially written last record has no newline yet
+            return [JournalEntry.from_dict(json.loads(line)) for line in f if line.endswith(b'\n')]
+
+    def load_in_background(self):
+        """Start parsing the log on a background thread"""
+        if self._entries is None and self._loader is None:
+            self._loader = threading.Thread(target=self._load, args=(self.count,),
+                                            name='JournalLoader', daemon=True)
+            self._loader.start()
+    
+    def _load(self, count):
+        entries = []
+        if count:
+            with open(self.log_file, 'rb') as f:
+                for line in f:
+                    entries.append(JournalEntry.from_dict(json.loads(line)))
+                    if len(entries) == count:
+                        break
+                    if len(entries) % self.LOAD_CHUNK == 0:
+                        time.sleep(0)  # Let the frame loop run
+        with self._lock:
+            entries.extend(self._appended)
+            self._appended = []
+            self._entries = entries
+    
+    def is_loaded(self):
+        """Whether the in-memory entry list is ready without blocking"""
+        return self._entries is not None
+    
+    def entries(self):
+        """Return every entry as a list, loading the log now if still needed"""
+        if self._entries is None:
+            if self._loader is not None:
+                self._loader.join()
+            else:
+                self._load(self.count)
+        self._loader = None
+        return self._entries
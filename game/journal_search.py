@@ -0,0 +1,143 @@
+import threading
+import time
+from array import array
+import numpy as np
+
+def trigrams(text):
+    """Set of lowercase three-character substrings of text"""
+    text = text.lower()
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+class TrigramIndex:
+    """Substring search over journal entries using a trigram inverted index.
+
+    Each trigram maps to a compact array of the positions of the entries
+    that contain it. A query is answered from the intersection of the
+    shortest few posting lists of its trigrams, with each candidate
+    confirmed by a substring check, so the work scales with how rare the
+    query is rather than with journal size.
+    Positions are indexes into the journal's entry list, which only grows.
+    """
+
+    # Entries indexed between GIL hand-offs when building in the background
+    BUILD_CHUNK = 500
+
+    # Posting lists intersected per query; past the shortest few, each one
+    # costs more to intersect than it saves in substring checks
+    INTERSECT_LISTS = 3
+
+    # Positions of the shortest list intersected at a time, newest first, so
+    # queries that fill the result limit early stop early
+    INTERSECT_CHUNK = 1024
+
+    def __init__(self):
+        self.postings = {}
+        self.size = 0  # Number of leading journal entries already indexed
+        self.started = False
+        self._lock = threading.Lock()
+        self._builder = None
+
+    def _add(self, text):
+        position = self.size
+        postings = self.postings
+        for trigram in trigrams(text):
+            posting = postings.get(trigram)
+            if posting is None:
+                posting = postings[trigram] = array('I')
+            posting.append(position)
+        self.size += 1
+
+    def update(self, entries):
+        """Index any entries past the ones already indexed"""
+        with self._lock:
+            for entry in entries[self.size:]:
+                self._add(entry.text)
+
+    def add_latest(self, get_entries):
+        """Index newly appended entries, unless a background build will pick them up"""
+        if self.started and self._builder is None:
+            self.update(get_entries())
+
+    def build_in_background(self, get_entries):
+        """Index the whole journal on a background thread (once)"""
+        if self.started:
+            return
+        self.started = True
+
+        def build():
+            try:
+                entries = get_entries()
+                while self.size < len(entries):
+                    with self._lock:
+                        for entry in entries[self.size:self.size + self.BUILD_CHUNK]:
+                            self._add(entry.text)
+                    time.sleep(0)  # Let the frame loop run
+            except Exception as e:
+                print(f"Error indexing journal: {e}")
+            finally:
+                # From here on add_latest indexes new entries (and anything missed)
+                self._builder = None
+
+        self._builder = threading.Thread(target=build, name='JournalIndexer', daemon=True)
+        self._builder.start()
+
+    def search(self, query, entries, limit=200):
+        """Return up to limit entries containing query (case-insensitive), newest first"""
+        query = query.lower()
+        if not query:
+            return []
+
+        results = []
+
+        # Entries the index hasn't reached yet are checked directly
+        indexed = min(self.size, len(entries))
+        for position in range(len(entries) - 1, indexed - 1, -1):
+            if query in entries[position].text.lower():
+                results.append(entries[position])
+                if len(results) >= limit:
+                    return results
+
+        if len(query) < 3:
+            # Too short for trigrams; short queries match often, so scanning
+            # newest first reaches the limit quickly
+            candidates = range(indexed - 1, -1, -1)
+        else:
+            with self._lock:
+                posting_lists = [self.postings.get(trigram) for trigram in trigrams(query)]
+                if any(posting is None for posting in posting_lists):
+                    return results
+            posting_lists.sort(key=len)
+            candidates = self._intersect_newest_first(posting_lists[:self.INTERSECT_LISTS])
+
+        for position in candidates:
+            if position < indexed and query in entries[position].text.lower():
+                results.append(entries[position])
+                if len(results) >= limit:
+                    break
+        return results
+
+    def _intersect_newest_first(self, posting_lists):
+        """Yield the positions in every one of posting_lists (shortest first), newest first.
+
+        Queries of common words have no short posting list, but their rarer
+        trigrams (often across word boundaries) seldom occur together, so
+        intersecting a few lists leaves far fewer entries to check.
+        """
+        end = len(posting_lists[0])
+        while end > 0:
+            start = max(0, end - self.INTERSECT_CHUNK)
+            # The builder can't grow an array while NumPy views it, so the
+            # views only live under the lock
+            with self._lock:
+                views = [np.frombuffer(posting, dtype=np.uintc) for posting in posting_lists]
+                chunk = views[0][start:end].copy()
+                for view in views[1:]:
+                    if not len(chunk):
+                        break
+                    # Only the part of the longer list that overlaps this chunk
+                    low = np.searchsorted(view, chunk[0], side='left')
+                    high = np.searchsorted(view, chunk[-1], side='right')
+                    chunk = np.intersect1d(chunk, view[low:high], assume_unique=True)
+                view = views = None
+            yield from reversed(chunk.tolist())
+            end = start
@@ -0,0 +1,109 @@
+import json
+import re
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+# Characters that can continue a number cut off at the end of the buffer
+_NUMBER_TAIL = re.compile(r'[0-9.eE+-]*')
+
+class JSONStreamReader:
+    """Incremental reader for a JSON document stored in a file.
+    
+    Values are decoded one at a time from a sliding buffer, so a large
+    top-level object can be walked without ever holding the whole document
+    (or the whole of one big array inside it) in memory.
+    """
+    
+    def __init__(self, f, chunk_size=65536):
+        self.file = f
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+    
+    def _fill(self):
+        """Read another chunk into the buffer, returns False at end of file"""
+        if self.eof:
+            return False
+        chunk = self.file.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+    
+    def peek(self):
+        """Return the next non-whitespace character without consuming it"""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ''
+    
+    def expect(self, char):
+        """Consume the next non-whitespace character, which must be char"""
+        if self.peek() != char:
+            raise ValueError(f"Expected '{char}' at offset {self.pos} of the buffer")
+        self.pos += 1
+    
+    def value(self):
+        """Decode and return the next complete JSON value"""
+        self.peek()
+        while True:
+            try:
+                obj, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number running up to the buffer edge may continue in the next
+            # chunk, even if what is there so far ('0.', '1e') didn't decode
+            if _NUMBER_TAIL.fullmatch(self.buffer, end) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return obj
+    
+    def iter_array(self):
+        """Yield the items of the array at the current position one by one"""
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ',':
+                self.pos += 1
+            else:
+                self.expect(']')
+                return
+
+def load_object_streaming(f, stream_key, on_item, chunk_size=65536):
+    """Load a top-level JSON object, streaming one array-valued key.
+    
+    Every item of the array stored under stream_key is passed to on_item as
+    soon as it is decoded instead of being collected. The remaining keys are
+    returned as a dict.
+    """
+    reader = JSONStreamReader(f, chunk_size)
+    data = {}
+    
+    reader.expect('{')
+    if reader.peek() == '}':
+        return data
+        
+    while True:
+        key = reader.value()
+        reader.expect(':')
+        if key == stream_key and reader.peek() == '[':
+            for item in reader.iter_array():
+                on_item(item)
+        else:
+            data[key] = reader.value()
+            
+        if reader.peek() == ',':
+            reader.pos += 1
+        else:
+            reader.expect('}')
+            return data
@@ -0,0 +1,201 @@
+import numpy as np
+import pygame
+
+class ParticleSystem:
+    """Particles stored as NumPy arrays (structure of arrays) and drawn in one blit.
+    
+    Each particle has an x/y position, a vertical speed in pixels per ms
+    (negative rises), a radius and a life that fades from 1 to 0. Updates
+    and culling are whole-array operations. Drawing stamps every particle's
+    disc, faded by its life, into the alpha channel of one layer, and only
+    the tiles of that layer that hold particles are blitted.
+    """
+    
+    MAX_SIZE = 8  # Largest particle radius the layer is padded for
+    TILE_SIZE = 64  # Only layer tiles holding particles are cleared and blitted
+    
+    def __init__(self, bounds, color, life_decay=0.0005):
+        self.bounds = pygame.Rect(bounds)
+        self.color = color
+        self.life_decay = life_decay  # Life lost per ms
+        self.rng = np.random.default_rng()
+        
+        self.x = np.empty(0, np.float32)
+        self.y = np.empty(0, np.float32)
+        self.speed = np.empty(0, np.float32)
+        self.size = np.empty(0, np.int32)
+        self.life = np.empty(0, np.float32)
+        
+        # The layer is padded by MAX_SIZE on every side so discs never need clipping
+        pad = self.MAX_SIZE
+        self.layer = pygame.Surface((self.bounds.width + 2 * pad, self.bounds.height + 2 * pad),
+                                    pygame.SRCALPHA)
+        self.layer.fill(tuple(color[:3]) + (0,))
+        
+        # Alpha is built in a contiguous [x, y] buffer (the layout of
+        # surfarray.pixels_alpha) so discs can be stamped through flat indexes
+        self.alpha = np.zeros(self.layer.get_size(), np.uint8)
+        self.alpha_flat = self.alpha.reshape(-1)
+        layer_height = self.layer.get_height()
+        
+        # Flat index offsets covering a disc of each radius
+        self.disc_offsets = {}
+        for radius in range(1, self.MAX_SIZE + 1):
+            dx, dy = np.mgrid[-radius:radius + 1, -radius:radius + 1]
+            inside = dx * dx + dy * dy <= radius * radius
+            self.disc_offsets[radius] = dx[inside] * layer_height + dy[inside]
+    
+    def __len__(self):
+        return len(self.life)
+    
+    def clear(self):
+        """Remove every particle"""
+        self.emit([], [], [], [], [])
+    
+    def emit(self, x, y, speed, size, life, replace=True):
+        """Add particles from equal-length sequences (replace=False keeps existing ones)"""
+        arrays = (np.asarray(x, np.float32), np.asarray(y, np.float32),
+                  np.asarray(speed, np.float32),
+                  np.clip(np.asarray(size, np.int32), 1, self.MAX_SIZE),
+                  np.asarray(life, np.float32))
+        if not replace:
+            arrays = tuple(np.concatenate((old, new)) for old, new in
+                           zip((self.x, self.y, self.speed, self.size, self.life), arrays))
+        self.x, self.y, self.speed, self.size, self.life = arrays
+        self._cull()
+    
+    def emit_random(self, count, x_range, y_range, speed_range, size_range, life_range):
+        """Add count particles with attributes drawn uniformly from (low, high) ranges"""
+        rng = self.rng
+        self.emit(rng.uniform(*x_range, count), rng.uniform(*y_range, count),
+                  rng.uniform(*speed_range, count),
+                  rng.integers(size_range[0], size_range[1] + 1, count),
+                  rng.uniform(*life_range, count), replace=False)
+    
+    def update(self, dt):
+        """Move and age every particle, dropping dead or off-screen ones"""
+        if not len(self.life):
+            return
+        self.y += self.speed * dt
+        self.life -= self.life_decay * dt
+        self._cull()
+    
+    def _cull(self):
+        """Drop dead particles and any outside the bounds"""
+        alive = ((self.life > 0)
+                 & (self.x >= self.bounds.left) & (self.x < self.bounds.right)
+                 & (self.y >= self.bounds.top) & (self.y < self.bounds.bottom))
+        if not alive.all():
+            self.x = self.x[alive]
+            self.y = self.y[alive]
+            self.speed = self.speed[alive]
+            self.size = self.size[alive]
+            self.life = self.life[alive]
+    
+    def draw(self, surface):
+        """Stamp all particles into the alpha layer and blit the tiles they touch"""
+        if not len(self.life):
+            return
+            
+        pad = self.MAX_SIZE
+        tile = self.TILE_SIZE
+        xs = (self.x - self.bounds.left).astype(np.intp) + pad
+        ys = (self.y - self.bounds.top).astype(np.intp) + pad
+        alphas = (np.clip(self.life, 0, 1) * 255).astype(np.uint8)
+        centers = xs * self.alpha.shape[1] + ys
+        
+        # Tiles touched by any particle's disc (a disc spans at most 2x2 tiles)
+        rows = -(-self.alpha.shape[1] // tile)
+        tile_ids = np.unique(np.concatenate([
+            ((xs + dx) // tile) * rows + (ys + dy) // tile
+            for dx in (-pad, pad) for dy in (-pad, pad)
+        ]))
+        box = pygame.Rect(int(xs.min()) - pad, int(ys.min()) - pad, 0, 0)
+        box.width = int(xs.max()) + pad + 1 - box.left
+        box.height = int(ys.max()) + pad + 1 - box.top
+        if len(tile_ids) * tile * tile > box.width * box.height // 2:
+            # Dense enough that one bounding box is cheaper than many tiles
+            tiles = [box.clip(self.layer.get_rect())]
+        else:
+            tiles = [pygame.Rect(tile_x * tile, tile_y * tile, tile, tile).clip(self.layer.get_rect())
+                     for tile_x, tile_y in zip(*np.divmod(tile_ids, rows))]
+        for rect in tiles:
+            self.alpha[rect.left:rect.right, rect.top:rect.bottom] = 0
+            
+        # Stamp each size's discs in one scatter. Writing in order of rising
+        # alpha lets the most opaque particle win where discs overlap.
+        order = np.argsort(alphas, kind='stable')
+        centers, alphas, sizes = centers[order], alphas[order], self.size[order]
+        for radius in np.unique(sizes):
+            group = sizes == radius
+            pixels = centers[group][:, None] + self.disc_offsets[int(radius)]
+            self.alpha_flat[pixels] = alphas[group][:, None]
+            
+        alpha = pygame.surfarray.pixels_alpha(self.layer)
+        for rect in tiles:
+            alpha[rect.left:rect.right, rect.top:rect.bottom] = \
+                self.alpha[rect.left:rect.right, rect.top:rect.bottom]
+        del alpha  # Unlock the layer before blitting
+        
+        offset_x = self.bounds.left - pad
+        offset_y = self.bounds.top - pad
+        surface.blits([(self.layer, (offset_x + rect.left, offset_y + rect.top), rect) for rect in tiles],
+                      doreturn=False)
+
+class SparkleField:
+    """Twinkling background sparkles stored as NumPy arrays.
+    
+    Sparkles drift up and wrap around the bounds. Their twinkle alpha is
+    quantized to a few levels, and each (radius, alpha level) pair is a
+    pre-rendered alpha sprite, so drawing is one Surface.blits call.
+    """
+    
+    def __init__(self, bounds, color=(255, 255, 200), max_radius=2, alpha_levels=8):
+        self.bounds = pygame.Rect(bounds)
+        self.alpha_levels = alpha_levels
+        self.max_radius = max_radius
+        self.rng = np.random.default_rng()
+        
+        self.x = np.empty(0, np.float32)
+        self.y = np.empty(0, np.float32)
+        self.radius = np.empty(0, np.intp)
+        
+        # sprites[radius * alpha_levels + level]; twinkle alpha runs from 150 to 255
+        sprites = []
+        for radius in range(max_radius + 1):
+            for level in range(alpha_levels):
+                alpha = int(150 + 105 * level / (alpha_levels - 1))
+                sprite = pygame.Surface((2 * radius + 1, 2 * radius + 1), pygame.SRCALPHA)
+                if radius:
+                    pygame.draw.circle(sprite, tuple(color) + (alpha,), (radius, radius), radius)
+                sprites.append(sprite)
+        self.sprites = np.empty(len(sprites), object)
+        self.sprites[:] = sprites
+    
+    def __len__(self):
+        return len(self.x)
+    
+    def reset(self, count, size_range=(0.5, 2.0)):
+        """Scatter count new sparkles over the bounds"""
+        rng = self.rng
+        self.x = rng.integers(self.bounds.left, self.bounds.right + 1, count).astype(np.float32)
+        self.y = rng.integers(self.bounds.top, self.bounds.bottom + 1, count).astype(np.float32)
+        radius = rng.uniform(*size_range, count).astype(np.intp)
+        self.radius = np.clip(radius, 0, self.max_radius)
+    
+    def update(self, dt, speed=0.2):
+        """Move every sparkle up by speed pixels per ms, wrapping at the top"""
+        self.y = (self.y - self.bounds.top - speed * dt) % self.bounds.height + self.bounds.top
+    
+    def draw(self, surface, elapsed_time):
+        """Blit each visible sparkle's sprite for its current twinkle"""
+        visible = self.radius > 0  # Radius 0 sparkles are too small to draw
+        x, y, radius = self.x[visible], self.y[visible], self.radius[visible]
+        if not len(x):
+            return
+            
+        twinkle = np.abs(np.sin(elapsed_time * 0.001 + x * 0.1))
+        levels = (twinkle * (self.alpha_levels - 1) + 0.5).astype(np.intp)
+        sprites = self.sprites[radius * self.alpha_levels + levels]
+        positions = zip((x.astype(np.intp) - radius).tolist(), (y.astype(np.intp) - radius).tolist())
+        surface.blits(zip(sprites, positions), doreturn=False)
@@ -0,0 +1,177 @@
+import json
+import os
+import threading
+from .json_stream import load_object_streaming
+from .save_format import SaveFormatError, encode_save, decode_save, migrate
+
+class PersistenceEngine:
+    """Snapshot plus write-ahead log persistence for the player state.
+    
+    Every mutation is appended to the WAL as a small op record tagged with
+    an increasing sequence number. Once ``compact_every`` ops have piled up
+    the caller writes a snapshot of the full state. Writing a snapshot keeps
+    the one it replaces as a backup, and the WAL is trimmed only to the ops
+    that backup does not cover. Loading replays the WAL tail on top of the
+    latest snapshot (or the backup, if the latest can't be read), skipping
+    any op the snapshot already includes, so recovery gives the same state
+    no matter where a crash happened.
+    
+    Appends are written and flushed to the OS right away, which is enough
+    to survive the game crashing. The fsync that makes them survive a power
+    cut is left to the writer thread, which covers a burst of ops with one;
+    an op is only at risk for the writer's coalesce delay after it.
+    """
+    
+    def __init__(self, snapshot_file, wal_file, writer, compact_every=50,
+                 legacy_snapshot_file=None):
+        self.snapshot_file = snapshot_file
+        self.backup_file = snapshot_file + '.bak'
+        self.legacy_snapshot_file = legacy_snapshot_file
+        self.wal_file = wal_file
+        self.writer = writer
+        self.compact_every = compact_every
+        self.seq = 0
+        self.ops_since_snapshot = 0
+        self.loaded_legacy = False
+        
+        # Seq covered by the snapshot the next write turns into the backup,
+        # and whether the current snapshot file is worth keeping as one
+        self.snapshot_seq = 0
+        self.keep_backup = True
+        self._lock = threading.Lock()
+        self._wal = None
+    
+    def load(self, on_journal_entry=None):
+        """Return the latest snapshot (or None) and the WAL ops to replay on top.
+        
+        Snapshots are stored in the binary save format. If the latest one is
+        damaged, the backup kept from the write before it is used instead
+        (the WAL still holds every op since). With neither, the WAL is
+        replayed on its own if it reaches back to the first op; otherwise
+        SaveFormatError is raised rather than quietly starting over.
+        
+        Older JSON snapshots are still read (and migrated forward) when there
+        is no binary one yet; they may carry the whole journal inline, so
+        those entries are streamed to on_journal_entry one at a time rather
+        than loaded at once. The JSON file itself is left in place, since
+        simple_run.py still reads and writes it.
+        """
+        on_journal_entry = on_journal_entry or (lambda entry: None)
+        snapshot = None
+        errors = []
+        for path in (self.snapshot_file, self.backup_file):
+            if not os.path.exists(path):
+                continue
+            try:
+                with open(path, 'rb') as f:
+                    snapshot = decode_save(f.read())
+                break
+            except (OSError, SaveFormatError) as e:
+                print(f"Error loading {path}: {e}")
+                errors.append(f"{path}: {e}")
+                
+        wal, wal_size = self._read_wal()
+        if (self.writer is not None and os.path.exists(self.wal_file)
+                and wal_size < os.path.getsize(self.wal_file)):
+            # Cut off a torn last record so the next append starts on a fresh
+            # line (read-only engines have no writer and leave the file alone)
+            with open(self.wal_file, 'rb+') as f:
+                f.truncate(wal_size)
+                
+        if errors and snapshot is None:
+            # Without a snapshot the WAL alone is only enough if it goes back to the first op
+            if not wal or wal[0]['seq'] != 1:
+                self.seq = wal[-1]['seq'] if wal else 0
+                self.keep_backup = False
+                raise SaveFormatError("No readable save snapshot (" + "; ".join(errors) + ")")
+            self.keep_backup = False
+        elif snapshot is not None:
+            for entry in snapshot.pop('journal_entries'):
+                on_journal_entry(entry)
+            # Don't let a damaged latest snapshot replace the good backup
+            self.keep_backup = not errors
+        elif self.legacy_snapshot_file and os.path.exists(self.legacy_snapshot_file):
+            with open(self.legacy_snapshot_file, 'r', encoding='utf-8') as f:
+                snapshot = load_object_streaming(f, 'journal_entries', on_journal_entry)
+            snapshot = migrate(snapshot, 0)
+            snapshot.pop('journal_entries')
+            self.loaded_legacy = True
+                
+        snapshot_seq = snapshot.get('seq', 0) if snapshot else 0
+        ops = [op for op in wal if op['seq'] > snapshot_seq]
+        
+        self.snapshot_seq = snapshot_seq
+        self.seq = ops[-1]['seq'] if ops else snapshot_seq
+        self.ops_since_snapshot = len(ops)
+        return snapshot, ops
+    
+    def _read_wal(self):
+        """Return the WAL ops and the size of the file up to the last complete one"""
+        if not os.path.exists(self.wal_file):
+            return [], 0
+            
+        ops = []
+        size = 0
+        with open(self.wal_file, 'rb') as f:
+            for line in f:
+                # A torn write can only be the last record; nothing after it is valid
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    ops.append(json.loads(line))
+                except ValueError:
+                    break
+                size += len(line)
+        return ops, size
+    
+    def append(self, op):
+        """Append an op record to the WAL"""
+        with self._lock:
+            self.seq += 1
+            op['seq'] = self.seq
+            if self._wal is None:
+                self._wal = open(self.wal_file, 'ab')
+            self._wal.write((json.dumps(op, separators=(',', ':')) + '\n').encode('utf-8'))
+            self._wal.flush()
+        self.writer.sync(self.wal_file)
+        self.ops_since_snapshot += 1
+    
+    def needs_snapshot(self):
+        """Whether enough ops have been logged to compact into a snapshot"""
+        return self.ops_since_snapshot >= self.compact_every
+    
+    def snapshot(self, state):
+        """Queue a snapshot of state covering every op logged so far"""
+        seq = self.seq
+        payload = encode_save(dict(state, seq=seq))
+        backup_file = self.backup_file if self.keep_backup else None
+        self.writer.submit(self.snapshot_file, payload, backup_path=backup_file,
+                           on_written=lambda: self._trim(seq))
+        self.ops_since_snapshot = 0
+    
+    def _trim(self, snapshot_seq):
+        """Drop WAL ops covered by the backup snapshot (runs on the writer thread)"""
+        with self._lock:
+            if self._wal is not None:
+                self._wal.close()
+                self._wal = None
+                
+            # The backup may be needed if the new snapshot is damaged, so keep its ops
+            remaining = [op for op in self._read_wal()[0] if op['seq'] > self.snapshot_seq]
+            self.snapshot_seq = snapshot_seq
+            self.keep_backup = True
+            
+            temp_path = self.wal_file + '.tmp'
+            with open(temp_path, 'wb') as f:
+                for op in remaining:
+                    f.write((json.dumps(op, separators=(',', ':')) + '\n').encode('utf-8'))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.wal_file)
+    
+    def close(self):
+        """Close the WAL file handle"""
+        with self._lock:
+            if self._wal is not None:
+                self._wal.close()
+                self._wal = None
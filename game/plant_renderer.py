@@ -1,11 +1,15 @@
 import pygame
 import math
-import random
+from collections import OrderedDict
+from .particles import ParticleSystem
 
 class PlantRenderer:
     """Renders the plant in a Minecraft-inspired blocky pixel art style"""
     
-    def __init__(self, screen_rect):
+    # Transparent color of cached layers; none of the plant or pot colors use it
+    CACHE_COLORKEY = (255, 0, 255)
+    
+    def __init__(self, screen_rect, sprite_cache_size=64, sway_phases=32, level_steps=20):
         self.screen_rect = screen_rect
         self.plant_levels = 10  # Maximum plant growth levels
         self.colors = {
@@ -21,20 +25,60 @@ class PlantRenderer:
         }
         
         # Calculate dimensions
-        self.pot_width = min(screen_rect.width // 4, 150)
-        self.pot_height = self.pot_width // 2
-        self.plant_base_width = self.pot_width // 3
+        self._calculate_dimensions()
+        
+        # Pot and soil never change for a given screen size, so they are
+        # baked into one surface and blitted each frame
+        self.static_layer = None
+        self.static_layer_pos = (0, 0)
+        self.static_layer_size = None  # Screen size the layer was baked for
+        
+        # The plant only changes with its level and the (periodic) sway, so
+        # frames are rendered once per quantized (level, sway phase) and kept
+        # in an LRU cache. sprite_cache_size=0 draws every frame directly.
+        self.sprite_cache = OrderedDict()
+        self.sprite_cache_size = sprite_cache_size
+        self.sway_phases = sway_phases  # Sway positions per full sway cycle
+        self.level_steps = level_steps  # Growth positions per plant level
+        self.sprite_cache_hits = 0
+        self.sprite_cache_misses = 0
         
         # Animation variables
         self.sway_angle = 0
-        self.sway_speed = 0.03
+        self.sway_speed = 0.0018  # Radians per ms (about 0.03 per frame at 60 FPS)
         self.sway_amount = 5
         
-        # Particle effects for watering
-        self.water_particles = []
-        self.particle_timer = 0
+        # Particle effects for watering and growth
+        self.water_particles = ParticleSystem(screen_rect, (100, 150, 255))
+        self.growth_particles = ParticleSystem(screen_rect, self.colors['plant_highlight'])
         
         self.growth_flash = 0  # Flash effect for growth
+    
+    def _calculate_dimensions(self):
+        """Size the pot from the screen"""
+        self.pot_width = min(self.screen_rect.width // 4, 150)
+        self.pot_height = self.pot_width // 2
+        self.plant_base_width = self.pot_width // 3
+    
+    def _bake_static_layer(self):
+        """Render the pot and soil once into a colorkeyed surface"""
+        self._calculate_dimensions()
+        center_x = self.screen_rect.centerx
+        base_y = self.screen_rect.centery + self.pot_height // 2
+        
+        # Bounding box of the pot rim, pot body and soil, plus room for line widths
+        margin = 10
+        left = center_x - self.pot_width // 2 - margin
+        top = base_y - self.pot_height - margin
+        width = self.pot_width + 2 * margin
+        height = self.pot_height + 2 * margin
+        
+        layer = self._keyed_surface(width, height)
+        self._draw_static(layer, center_x - left, base_y - top)
+        
+        self.static_layer = layer
+        self.static_layer_pos = (left, top)
+        self.static_layer_size = self.screen_rect.size
         
     def update(self, dt):
         """Update animation variables"""
@@ -42,38 +86,43 @@ class PlantRenderer:
         self.sway_angle += self.sway_speed * dt
         
         # Update particles
-        self.particle_timer -= dt
-        if self.particle_timer <= 0:
-            self.water_particles = [p for p in self.water_particles if p['life'] > 0]
-        
-        for particle in self.water_particles:
-            particle['y'] += particle['speed'] * dt
-            particle['life'] -= dt * 0.5
+        self.water_particles.update(dt)
+        self.growth_particles.update(dt)
             
-        # Update growth flash
+        # Update growth flash (fades over about a third of a second)
         if self.growth_flash > 0:
-            self.growth_flash -= dt * 0.05
+            self.growth_flash = max(0.0, self.growth_flash - dt * 0.003)
     
     def add_water_effect(self):
         """Add water particle effect"""
-        self.particle_timer = 600  # milliseconds
-        
         # Create water droplets
         pot_center_x = self.screen_rect.centerx
         pot_top_y = self.screen_rect.centery + self.pot_height // 2
         
-        for _ in range(20):
-            self.water_particles.append({
-                'x': pot_center_x + random.randint(-self.pot_width//2, self.pot_width//2),
-                'y': pot_top_y - random.randint(100, 200),
-                'speed': random.uniform(0.1, 0.3),
-                'size': random.randint(2, 5),
-                'life': random.uniform(0.5, 1.0)
-            })
+        self.water_particles.emit_random(
+            20,
+            x_range=(pot_center_x - self.pot_width // 2, pot_center_x + self.pot_width // 2),
+            y_range=(pot_top_y - 200, pot_top_y - 100),
+            speed_range=(0.1, 0.3),
+            size_range=(2, 5),
+            life_range=(0.5, 1.0)
+        )
     
     def add_growth_effect(self):
         """Add growth flash effect"""
         self.growth_flash = 1.0
+        
+        # Sparks drifting up around the plant
+        center_x = self.screen_rect.centerx
+        base_y = self.screen_rect.centery + self.pot_height // 2
+        self.growth_particles.emit_random(
+            30,
+            x_range=(center_x - self.pot_width // 2, center_x + self.pot_width // 2),
+            y_range=(base_y - 250, base_y - 20),
+            speed_range=(-0.08, -0.03),
+            size_range=(1, 3),
+            life_range=(0.6, 1.0)
+        )
     
     def draw(self, surface, plant_level, growth_progress):
         """Draw the plant at the given growth level and progress"""
@@ -83,6 +132,71 @@ class PlantRenderer:
         # Calculate current growth
         effective_level = plant_level - 1 + growth_progress
         
+        # Draw the pot and soil from the cached layer
+        if self.static_layer is None or self.static_layer_size != self.screen_rect.size:
+            self._bake_static_layer()
+            base_y = self.screen_rect.centery + self.pot_height // 2
+        surface.blit(self.static_layer, self.static_layer_pos)
+        
+        # Draw plant based on level
+        if effective_level > 0:
+            if self.sprite_cache_size and self.growth_flash <= 0:
+                sprite, offset = self._get_plant_sprite(effective_level)
+                surface.blit(sprite, (center_x - offset[0], base_y - offset[1]))
+            else:
+                # The growth flash is brief, so draw it directly rather than cache it
+                self._draw_plant(surface, center_x, base_y, effective_level, self.sway_angle, self.growth_flash)
+        
+        # Draw particles, each system as a single alpha blit
+        self.water_particles.draw(surface)
+        self.growth_particles.draw(surface)
+    
+    def _keyed_surface(self, width, height):
+        """Blank colorkeyed surface for caching opaque, non-antialiased drawing.
+        
+        Colorkey blits with RLE acceleration are much cheaper than per-pixel alpha.
+        """
+        surface = pygame.Surface((width, height))
+        surface.fill(self.CACHE_COLORKEY)
+        surface.set_colorkey(self.CACHE_COLORKEY, pygame.RLEACCEL)
+        return surface
+    
+    def _get_plant_sprite(self, effective_level):
+        """Cached plant sprite for the current sway, plus the pot base position within it"""
+        level_key = round(effective_level * self.level_steps)
+        phase_key = int(self.sway_angle % (2 * math.pi) / (2 * math.pi) * self.sway_phases) % self.sway_phases
+        key = (level_key, phase_key)
+        
+        cached = self.sprite_cache.get(key)
+        if cached is not None:
+            self.sprite_cache.move_to_end(key)
+            self.sprite_cache_hits += 1
+            return cached
+            
+        self.sprite_cache_misses += 1
+        cached = self._render_plant_sprite(level_key / self.level_steps,
+                                           phase_key / self.sway_phases * 2 * math.pi)
+        self.sprite_cache[key] = cached
+        if len(self.sprite_cache) > self.sprite_cache_size:
+            self.sprite_cache.popitem(last=False)  # Evict the least recently used
+        return cached
+    
+    def _render_plant_sprite(self, level, sway_angle):
+        """Render the plant onto a transparent (colorkeyed) surface just big enough to hold it"""
+        # Leaves reach about 2.5x their size (30 at most) out from the stem,
+        # and the flower about 30 above the stem top
+        half_width = 100
+        below = 40
+        stem_height = int(300 * (level / self.plant_levels))
+        height = stem_height + below + 60
+        
+        sprite = self._keyed_surface(half_width * 2, height)
+        base_x, base_y = half_width, height - below
+        self._draw_plant(sprite, base_x, base_y, level, sway_angle)
+        return sprite, (base_x, base_y)
+    
+    def _draw_static(self, surface, center_x, base_y):
+        """Draw the pot and soil directly (used to bake the static layer)"""
         # Draw pot (3D blocky style)
         self._draw_pot(surface, center_x, base_y)
         
@@ -94,21 +208,6 @@ class PlantRenderer:
             20
         )
         pygame.draw.rect(surface, self.colors['soil'], soil_rect)
-        
-        # Draw plant based on level
-        if effective_level > 0:
-            self._draw_plant(surface, center_x, base_y, effective_level)
-        
-        # Draw water particles
-        for particle in self.water_particles:
-            alpha = int(255 * particle['life'])
-            color = (100, 150, 255, alpha)
-            pygame.draw.circle(
-                surface, 
-                color, 
-                (int(particle['x']), int(particle['y'])), 
-                int(particle['size'])
-            )
     
     def _draw_pot(self, surface, center_x, base_y):
         """Draw the Minecraft-style blocky pot"""
@@ -167,7 +266,7 @@ class PlantRenderer:
         )
         pygame.draw.rect(surface, self.colors['pot_shadow'], rim_rect)
     
-    def _draw_plant(self, surface, center_x, base_y, level):
+    def _draw_plant(self, surface, center_x, base_y, level, sway_angle, flash=0.0):
         """Draw the plant with Minecraft-inspired blocky style"""
         stem_base_x = center_x
         stem_base_y = base_y - 10  # Just above the soil
@@ -177,10 +276,10 @@ class PlantRenderer:
         stem_height = int(max_stem_height * (level / self.plant_levels))
         
         # Apply swaying effect
-        sway = math.sin(self.sway_angle) * self.sway_amount
+        sway = math.sin(sway_angle) * self.sway_amount
         
         # Apply growth flash effect
-        highlight_factor = self.growth_flash * 50
+        highlight_factor = flash * 50
         stem_color = tuple(min(255, c + int(highlight_factor)) for c in self.colors['plant_stem'])
         leaf_color = tuple(min(255, c + int(highlight_factor)) for c in self.colors['plant_leaf'])
         
@@ -225,8 +324,8 @@ class PlantRenderer:
             leaf_size = int(leaf_size_base + leaf_size_base * 2 * leaf_growth)
             
             # Alternate leaf directions
-            left_leaf_angle = 180 + 20 + math.sin(self.sway_angle) * 5
-            right_leaf_angle = 0 - 20 + math.sin(self.sway_angle) * 5
+            left_leaf_angle = 180 + 20 + math.sin(sway_angle) * 5
+            right_leaf_angle = 0 - 20 + math.sin(sway_angle) * 5
             
             # Draw left leaf
             self._draw_leaf(surface, leaf_center_x, leaf_center_y, leaf_size, left_leaf_angle, leaf_color)
@@ -245,7 +344,7 @@ class PlantRenderer:
             
             # Draw petals
             for angle in range(0, 360, 60):
-                petal_angle = angle + math.sin(self.sway_angle) * 5
+                petal_angle = angle + math.sin(sway_angle) * 5
                 rad = math.radians(petal_angle)
                 petal_x = top_x + math.cos(rad) * flower_size * 0.7
                 petal_y = top_y + math.sin(rad) * flower_size * 0.7
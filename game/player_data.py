@@ -1,19 +1,47 @@
-import json
 import os
 import datetime
+from .snapshot_store import SnapshotStore, SnapshotReader
+from .sqlite_store import SQLiteStore
+from .journal_entry import JournalEntry
+from .journal_search import TrigramIndex
 
 class PlayerData:
     """Manages player progress and game state data"""
     
-    def __init__(self):
-        self.save_file = 'player_data.json'
+    # Messages unlocked when the plant reaches each level
+    LEVEL_MESSAGES = {
+        2: "You're making great progress! Just like this plant, you're growing every day.",
+        3: "Look how much you've grown! Remember, everyone starts somewhere.",
+        4: "Your dedication is inspiring! You're proving that persistence pays off.",
+        5: "You've reached level 5! Your journey in CS is just like this plant - needing care and patience.",
+        6: "The plant is flourishing! Remember that doubt is normal, but don't let it stop you.",
+        7: "Amazing growth! Similarly, your coding skills grow with each challenge you face.",
+        8: "You've created something beautiful! Your potential in CS is just as limitless.",
+        9: "Nearly at the top! Remember that even experts were beginners once.",
+        10: "Maximum level reached! You've shown incredible persistence - carry this into your studies!"
+    }
+    
+    def __init__(self, backend='json', store=None):
+        self.save_file = 'player_data.sav'
+        self.legacy_save_file = 'player_data.json'
+        self.db_file = 'player_data.db'
+        
+        # Storage backend, chosen once at construction (or passed in as store)
+        if store is not None:
+            self.store = store
+        elif backend == 'sqlite':
+            self.store = self._open_sqlite()
+        else:
+            self.store = SnapshotStore(self.save_file, legacy_save_file=self.legacy_save_file)
+            
+        # Full-text search index, built the first time the journal is searched
+        self.journal_index = TrigramIndex()
         
         # Default values
         self.plant_level = 1
         self.plant_growth = 0.0  # 0.0 to 1.0 for each level
         self.watered_today = False
         self.affirmation_done_today = False
-        self.journal_entries = []
         self.unlocked_messages = [
             "You're at the beginning of an amazing journey!"
         ]
@@ -22,111 +50,176 @@ class PlayerData:
         # Try to load saved data
         self.load_data()
     
-    def save_data(self):
-        """Save player data to file"""
-        data = {
+    def _open_sqlite(self):
+        """Open the SQLite save, copying an existing file save into it first"""
+        has_file_save = os.path.exists(self.save_file) or os.path.exists(self.legacy_save_file)
+        if not os.path.exists(self.db_file) and has_file_save:
+            try:
+                migrate_json_to_sqlite(self.db_file)
+            except Exception as e:
+                # Keep playing on the file save rather than starting a new one
+                print(f"Error migrating save to SQLite: {e}")
+                return SnapshotStore(self.save_file, legacy_save_file=self.legacy_save_file)
+        return SQLiteStore(self.db_file)
+    
+    def _state(self):
+        """The scalar player state as a plain dict"""
+        return {
             'plant_level': self.plant_level,
             'plant_growth': self.plant_growth,
             'watered_today': self.watered_today,
             'affirmation_done_today': self.affirmation_done_today,
-            'journal_entries': self.journal_entries,
-            'unlocked_messages': self.unlocked_messages,
+            'unlocked_messages': list(self.unlocked_messages),
             'last_login': self.last_login
         }
         
-        try:
-            with open(self.save_file, 'w') as f:
-                json.dump(data, f, indent=2)
-        except Exception as e:
-            print(f"Error saving data: {e}")
+    def save_data(self):
+        """Save the scalar player state (journal entries are stored separately)"""
+        self.store.save(self._state())
+    
+    def close(self):
+        """Flush pending saves and release the storage backend"""
+        if self.store.has_pending_ops():
+            self.save_data()
+        self.store.close()
+    
+    @property
+    def journal_entries(self):
+        """All journal entries, oldest first (parsed on first use if still loading)"""
+        return self.store.journal_entries()
+    
+    def journal_count(self):
+        """Number of journal entries"""
+        return self.store.journal_count()
+    
+    def journal_page(self, offset, limit):
+        """Journal entries [offset, offset + limit), oldest first"""
+        return self.store.journal_page(offset, limit)
+    
+    def prepare_journal_search(self):
+        """Start indexing the journal in the background so searches are fast"""
+        self.journal_index.build_in_background(self.store.journal_entries)
+    
+    def search_journal(self, query, limit=200):
+        """Journal entries containing query (case-insensitive), newest first"""
+        self.prepare_journal_search()
+        return self.journal_index.search(query, self.journal_entries, limit)
+    
+    @property
+    def journal_dates(self):
+        """The by-day journal index, including any entries added since last use"""
+        return self.store.journal_dates()
     
     def load_data(self):
-        """Load player data from file"""
-        if not os.path.exists(self.save_file):
-            # No save file exists yet
+        """Load the saved state and replay any logged ops on top of it"""
+        try:
+            data, ops = self.store.load()
+        except Exception as e:
+            print(f"Error loading data: {e}")
             return
             
-        try:
-            with open(self.save_file, 'r') as f:
-                data = json.load(f)
-                
+        if data:
             self.plant_level = data.get('plant_level', 1)
             self.plant_growth = data.get('plant_growth', 0.0)
             self.watered_today = data.get('watered_today', False)
             self.affirmation_done_today = data.get('affirmation_done_today', False)
-            self.journal_entries = data.get('journal_entries', [])
-            self.unlocked_messages = data.get('unlocked_messages', 
+            self.unlocked_messages = data.get('unlocked_messages',
                                             ["You're at the beginning of an amazing journey!"])
             self.last_login = data.get('last_login', datetime.datetime.now().strftime("%Y-%m-%d"))
             
-            # Check if it's a new day since last login
-            today = datetime.datetime.now().strftime("%Y-%m-%d")
-            if today != self.last_login:
-                self.reset_daily()
-                self.last_login = today
+        for op in ops:
+            self._apply(op)
                 
-        except Exception as e:
-            print(f"Error loading data: {e}")
+        if self.store.needs_rewrite:
+            # Rewrite an old JSON save in the current format
+            self.save_data()
+            
+        # Check if it's a new day since last login
+        today = datetime.datetime.now().strftime("%Y-%m-%d")
+        if today != self.last_login:
+            self.reset_daily()
+    
+    def _apply(self, op):
+        """Apply a single op to the in-memory state (shared by live updates and replay)"""
+        kind = op['op']
+        if kind == 'water':
+            self.watered_today = True
+        elif kind == 'affirmation':
+            self.affirmation_done_today = True
+        elif kind == 'reset_daily':
+            self.watered_today = False
+            self.affirmation_done_today = False
+            self.last_login = op['date']
+        elif kind == 'level_up':
+            self.plant_level += 1
+            self.plant_growth = 0.0
+            
+            # Unlock new message based on level
+            if self.plant_level in self.LEVEL_MESSAGES:
+                self.unlocked_messages.append(self.LEVEL_MESSAGES[self.plant_level])
+                
+        self.plant_growth += op.get('growth', 0.0)
+    
+    def _record(self, op):
+        """Apply an op to the in-memory state and persist it"""
+        self._apply(op)
+        self.store.record(op, self._state())
+        
+        # Check for level up
+        if op['op'] != 'level_up' and self.plant_growth >= 1.0:
+            self.level_up()
     
     def reset_daily(self):
         """Reset daily activities"""
-        self.watered_today = False
-        self.affirmation_done_today = False
-        self.save_data()
+        today = datetime.datetime.now().strftime("%Y-%m-%d")
+        self._record({'op': 'reset_daily', 'date': today})
     
     def water_plant(self):
         """Water the plant to increase growth"""
         if not self.watered_today:
-            self.watered_today = True
-            self.add_growth(0.15)  # Add 15% growth
+            self._record({'op': 'water', 'growth': 0.15})  # Add 15% growth
             return True
         return False
     
     def complete_affirmation(self):
         """Complete an affirmation challenge"""
         if not self.affirmation_done_today:
-            self.affirmation_done_today = True
-            self.add_growth(0.2)  # Add 20% growth
+            self._record({'op': 'affirmation', 'growth': 0.2})  # Add 20% growth
             return True
         return False
     
     def add_journal_entry(self, entry):
         """Add a new journal entry"""
-        today = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
-        self.journal_entries.append({
-            'date': today,
-            'text': entry
-        })
-        self.add_growth(0.1)  # Add 10% growth for journaling
-        self.save_data()
+        self.store.append_journal(JournalEntry.now(entry))
+        self.journal_index.add_latest(self.store.journal_entries)
+        self._record({'op': 'journal', 'growth': 0.1})  # Add 10% growth for journaling
     
     def add_growth(self, amount):
         """Add growth to the plant, level up if needed"""
-        self.plant_growth += amount
-        
-        # Check for level up
-        if self.plant_growth >= 1.0:
-            self.level_up()
-        
-        self.save_data()
+        self._record({'op': 'growth', 'growth': amount})
     
     def level_up(self):
         """Level up the plant and unlock new messages"""
-        self.plant_level += 1
-        self.plant_growth = 0.0
-        
-        # Unlock new message based on level
-        messages = {
-            2: "You're making great progress! Just like this plant, you're growing every day.",
-            3: "Look how much you've grown! Remember, everyone starts somewhere.",
-            4: "Your dedication is inspiring! You're proving that persistence pays off.",
-            5: "You've reached level 5! Your journey in CS is just like this plant - needing care and patience.",
-            6: "The plant is flourishing! Remember that doubt is normal, but don't let it stop you.",
-            7: "Amazing growth! Similarly, your coding skills grow with each challenge you face.",
-            8: "You've created something beautiful! Your potential in CS is just as limitless.",
-            9: "Nearly at the top! Remember that even experts were beginners once.",
-            10: "Maximum level reached! You've shown incredible persistence - carry this into your studies!"
-        }
-        
-        if self.plant_level in messages:
-            self.unlocked_messages.append(messages[self.plant_level])
+        self._record({'op': 'level_up'})
+
+def migrate_json_to_sqlite(db_file='player_data.db'):
+    """One-shot copy of the file save (snapshot, WAL and journal log) into SQLite.
+    
+    The file save is only read, never written. Raises if it can't be read,
+    and returns False without touching anything if the database already
+    holds a save.
+    """
+    reader = SnapshotReader()
+    reader.load()  # Fail here, before the database is created
+    source = PlayerData(store=reader)
+    
+    target = SQLiteStore(db_file)
+    try:
+        if not target.is_empty():
+            return False
+            
+        target.extend_journal(source.journal_entries)
+        target.save(source._state())
+    finally:
+        target.close()
+    return True
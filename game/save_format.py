@@ -0,0 +1,137 @@
+import struct
+from .journal_entry import parse_date
+
+# Binary save layout (all integers little endian):
+#
+#   header   magic, schema version, flags, plant level, plant growth, WAL seq
+#   strings  last_login, then a count followed by every unlocked message
+#   journal  a count followed by (int64 epoch timestamp, text) pairs
+#
+# Every string is stored as a uint32 byte length followed by UTF-8 bytes.
+
+MAGIC = b'MPSV'
+SCHEMA_VERSION = 1
+
+HEADER = struct.Struct('<4sHHIdQ')
+LENGTH = struct.Struct('<I')
+TIMESTAMP = struct.Struct('<q')
+
+FLAG_WATERED = 1 << 0
+FLAG_AFFIRMATION = 1 << 1
+
+class SaveFormatError(ValueError):
+    """Raised when a save file can't be decoded"""
+
+def _migrate_from_json(data):
+    """Version 0 is the original JSON save; journal dates become epoch timestamps"""
+    data = dict(data)
+    data.setdefault('seq', 0)
+    data['journal_entries'] = [
+        {'ts': parse_date(entry['date']), 'text': entry['text']}
+        for entry in data.get('journal_entries', [])
+    ]
+    return data
+
+# Forward migrations: MIGRATIONS[n] turns a version n save dict into version n + 1
+MIGRATIONS = {
+    0: _migrate_from_json,
+}
+
+def migrate(data, version):
+    """Upgrade a decoded save dict from version to SCHEMA_VERSION"""
+    if version > SCHEMA_VERSION:
+        raise SaveFormatError(f"Save uses schema version {version}, newer than this game supports")
+    while version < SCHEMA_VERSION:
+        data = MIGRATIONS[version](data)
+        version += 1
+    return data
+
+def _pack_string(parts, text):
+    raw = text.encode('utf-8')
+    parts.append(LENGTH.pack(len(raw)))
+    parts.append(raw)
+
+def encode_save(data):
+    """Encode a save dict as bytes in the current schema version"""
+    flags = 0
+    if data.get('watered_today'):
+        flags |= FLAG_WATERED
+    if data.get('affirmation_done_today'):
+        flags |= FLAG_AFFIRMATION
+        
+    parts = [HEADER.pack(MAGIC, SCHEMA_VERSION, flags,
+                         data.get('plant_level', 1), data.get('plant_growth', 0.0),
+                         data.get('seq', 0))]
+    _pack_string(parts, data.get('last_login', ''))
+    
+    messages = data.get('unlocked_messages', [])
+    parts.append(LENGTH.pack(len(messages)))
+    for message in messages:
+        _pack_string(parts, message)
+        
+    journal = data.get('journal_entries', [])
+    parts.append(LENGTH.pack(len(journal)))
+    for entry in journal:
+        parts.append(TIMESTAMP.pack(entry['ts']))
+        _pack_string(parts, entry['text'])
+        
+    return b''.join(parts)
+
+def decode_save(payload):
+    """Decode bytes produced by encode_save (any known version) into a save dict"""
+    if len(payload) < HEADER.size or payload[:4] != MAGIC:
+        raise SaveFormatError("Not a MotivaPlant save file")
+        
+    magic, version, flags, plant_level, plant_growth, seq = HEADER.unpack_from(payload, 0)
+    if version > SCHEMA_VERSION:
+        raise SaveFormatError(f"Save uses schema version {version}, newer than this game supports")
+        
+    pos = HEADER.size
+    unpack_length = LENGTH.unpack_from
+    length_size = LENGTH.size
+    
+    def read_string():
+        nonlocal pos
+        (length,) = unpack_length(payload, pos)
+        pos += length_size
+        text = payload[pos:pos + length].decode()
+        pos += length
+        return text
+        
+    try:
+        last_login = read_string()
+        
+        (count,) = unpack_length(payload, pos)
+        pos += length_size
+        messages = [read_string() for _ in range(count)]
+        
+        (count,) = unpack_length(payload, pos)
+        pos += length_size
+        journal = []
+        append = journal.append
+        # Inlined read_string: this loop dominates load time for big journals
+        unpack_timestamp = TIMESTAMP.unpack_from
+        timestamp_size = TIMESTAMP.size
+        for _ in range(count):
+            (timestamp,) = unpack_timestamp(payload, pos)
+            pos += timestamp_size
+            (length,) = unpack_length(payload, pos)
+            pos += length_size
+            append({'ts': timestamp, 'text': payload[pos:pos + length].decode()})
+            pos += length
+    except struct.error as e:
+        raise SaveFormatError(f"Save file is truncated: {e}")
+    if pos > len(payload):
+        raise SaveFormatError("Save file is truncated")
+        
+    data = {
+        'plant_level': plant_level,
+        'plant_growth': plant_growth,
+        'watered_today': bool(flags & FLAG_WATERED),
+        'affirmation_done_today': bool(flags & FLAG_AFFIRMATION),
+        'unlocked_messages': messages,
+        'last_login': last_login,
+        'seq': seq,
+        'journal_entries': journal,
+    }
+    return migrate(data, version)
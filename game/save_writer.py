@@ -0,0 +1,126 @@
+import os
+import threading
+import time
+
+def write_atomic(path, payload, backup_path=None):
+    """Write bytes to path via a temp file, fsync and rename.
+
+    With backup_path, the file being replaced is kept there.
+    """
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    if backup_path and os.path.exists(path):
+        os.replace(path, backup_path)
+    os.replace(temp_path, path)
+
+class SaveWriter:
+    """Background thread that writes save files off the main loop.
+
+    Callers submit the bytes to write for a path. Submissions that arrive
+    while a write is pending replace the older payload, so a burst of saves
+    within ``coalesce_delay`` seconds ends up as a single atomic write.
+    
+    Files appended to on the main thread are made durable the same way:
+    sync() queues an fsync of the file, and every sync requested during a
+    burst is covered by one fsync per file (a group commit).
+    """
+
+    def __init__(self, coalesce_delay=0.05):
+        self.coalesce_delay = coalesce_delay
+        self._pending = {}
+        self._syncs = set()
+        self._writing = False
+        self._closed = False
+        self._flush_waiters = 0
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name='SaveWriter', daemon=True)
+        self._thread.start()
+
+    def submit(self, path, payload, on_written=None, backup_path=None):
+        """Queue payload to be written to path, replacing any pending write.
+        
+        on_written, if given, is called on the writer thread once the
+        payload is safely on disk. backup_path is passed to write_atomic.
+        """
+        with self._condition:
+            if self._closed:
+                # Writer already shut down, fall back to writing inline
+                self._write(path, payload, on_written, backup_path)
+                return
+            self._pending[path] = (payload, on_written, backup_path)
+            self._condition.notify_all()
+
+    def sync(self, path):
+        """Queue an fsync of path, which has been appended to and flushed"""
+        with self._condition:
+            if self._closed:
+                self._sync(path)
+                return
+            self._syncs.add(path)
+            self._condition.notify_all()
+
+    def flush(self):
+        """Block until every submitted payload has been written and synced"""
+        with self._condition:
+            self._flush_waiters += 1
+            self._condition.notify_all()
+            while self._pending or self._syncs or self._writing:
+                self._condition.wait()
+            self._flush_waiters -= 1
+
+    def close(self):
+        """Write anything still pending and stop the writer thread"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._syncs and not self._closed:
+                    self._condition.wait()
+                if not self._pending and not self._syncs and self._closed:
+                    return
+
+                # Give the rest of a burst a moment to arrive
+                deadline = time.monotonic() + self.coalesce_delay
+                while not self._closed and not self._flush_waiters:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+
+                batch = self._pending
+                syncs = self._syncs
+                self._pending = {}
+                self._syncs = set()
+                self._writing = True
+
+            for path in syncs:
+                self._sync(path)
+            for path, (payload, on_written, backup_path) in batch.items():
+                self._write(path, payload, on_written, backup_path)
+
+            with self._condition:
+                self._writing = False
+                self._condition.notify_all()
+
+    def _write(self, path, payload, on_written=None, backup_path=None):
+        try:
+            write_atomic(path, payload, backup_path)
+            if on_written:
+                on_written()
+        except Exception as e:
+            print(f"Error saving data: {e}")
+
+    def _sync(self, path):
+        try:
+            # fsync flushes the file itself, whichever handle wrote to it
+            with open(path, 'rb+') as f:
+                os.fsync(f.fileno())
+        except Exception as e:
+            print(f"Error syncing {path}: {e}")
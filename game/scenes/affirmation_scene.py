@@ -2,6 +2,7 @@ import pygame
 import random
 from ..ui.button import Button
 from ..ui.panel import Panel, MessagePanel
+from ..ui.dirty_rects import DirtyRects
 
 class AffirmationScene:
     """Scene for daily affirmations and positive self-talk exercises"""
@@ -21,6 +22,9 @@ class AffirmationScene:
         self.affirm_done = False
         self.selected_option = None
     
+        # Screen areas that changed since the last frame
+        self.dirty = DirtyRects()
+    
     def create_ui(self):
         """Create UI elements"""
         # Main panel background
@@ -34,6 +38,9 @@ class AffirmationScene:
             color=(220, 220, 240)  # Soft purple color
         )
         
+        # The title never changes, so render it once
+        self.title_surf = self.game_manager.title_font.render("Daily Affirmation", True, (50, 50, 100))
+        
         # Content panel for affirmations and prompts
         content_width = panel_width - 80
         content_height = panel_height - 200
@@ -43,7 +50,7 @@ class AffirmationScene:
         self.content_panel = MessagePanel(
             content_x, content_y, content_width, content_height,
             self.game_manager.main_font, title=None,
-            color=(240, 240, 255)
+            color=(240, 240, 255), prerender=True
         )
         
         # Option buttons for multiple choice
@@ -317,20 +324,33 @@ class AffirmationScene:
             self.option1_button.update(mouse_pos, mouse_clicked)
             self.option2_button.update(mouse_pos, mouse_clicked)
     
-    def update(self):
-        """Update scene state"""
+    def update(self, dt):
+        """Update scene state by dt milliseconds"""
         # Nothing to update regularly in this scene
         pass
     
+    def idle_timeout(self):
+        """Milliseconds until the scene changes without input (None: never, 0: animating)"""
+        return None
+    
+    def dirty_rects(self):
+        """Screen areas whose contents changed in the last draw"""
+        # Moving to another step shows or hides the option buttons
+        self.dirty.check('step', (self.current_step, self.affirm_done), self.main_panel.draw_rect())
+        widgets = [self.main_panel, self.content_panel, self.next_button, self.back_button]
+        if self.current_step == 2 and self.option1_button and self.option2_button:
+            widgets += [self.option1_button, self.option2_button]
+        self.dirty.check_widgets(widgets)
+        return self.dirty.take()
+    
     def draw(self, surface):
         """Draw the scene"""
         # Draw main background panel
         self.main_panel.draw(surface)
         
         # Draw title
-        title_surf = self.game_manager.title_font.render("Daily Affirmation", True, (50, 50, 100))
-        title_rect = title_surf.get_rect(midtop=(self.screen_rect.centerx, self.main_panel.rect.top + 20))
-        surface.blit(title_surf, title_rect)
+        title_rect = self.title_surf.get_rect(midtop=(self.screen_rect.centerx, self.main_panel.rect.top + 20))
+        surface.blit(self.title_surf, title_rect)
         
         # Draw content panel
         self.content_panel.draw(surface)
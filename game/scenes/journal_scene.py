@@ -1,11 +1,58 @@
+import re
+import datetime
 import pygame
+from ..journal_dates import entry_day, period_bounds
 from ..ui.button import Button, TextButton
 from ..ui.panel import Panel, MessagePanel
 from ..ui.text_input import TextInput
+from ..ui.dirty_rects import DirtyRects
+
+class EntryList:
+    """Display strings for a list of journal entries, read in chunks and formatted only when shown.
+    
+    read_page(offset, limit) returns the entries [offset, offset + limit),
+    and count is how many there are; grow() adds entries appended since.
+    """
+    
+    CHUNK = 64  # Entries read at a time
+    
+    def __init__(self, count, read_page, format_entry):
+        self.count = count
+        self.read_page = read_page
+        self.format_entry = format_entry
+        self.chunk_start = 0
+        self.chunk = []
+    
+    def __len__(self):
+        return self.count
+    
+    def __getitem__(self, index):
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        if not self.chunk_start <= index < self.chunk_start + len(self.chunk):
+            self.chunk_start = index - index % self.CHUNK
+            self.chunk = self.read_page(self.chunk_start, self.CHUNK)
+        return self.format_entry(self.chunk[index - self.chunk_start])
+    
+    def grow(self, added=1):
+        """Count entries appended to the underlying list"""
+        self.count += added
+        self.chunk = []
 
 class JournalScene:
     """Journal scene where the player can record thoughts and reflections"""
     
+    ENTRIES_TITLE = "Your Journal Entries"
+    
+    # Text lines the entries panel scrolls per mouse wheel step
+    WHEEL_LINES = 3
+    
+    # Formatted entry strings kept while scrolling
+    FORMAT_CACHE_LIMIT = 2000
+    
+    # Searches like "2024", "2024-05" or "2024-05-01" jump to that year, month or day
+    DATE_QUERY = re.compile(r'^(\d{4})(?:-(\d{1,2})(?:-(\d{1,2}))?)?$')
+    
     def __init__(self, game_manager):
         self.game_manager = game_manager
         self.screen_rect = game_manager.screen_rect
@@ -16,6 +63,16 @@ class JournalScene:
         # For managing keyboard focus
         self.active_input = None
         
+        # Current search, and the matching entries (None when not searching)
+        self.search_query = ""
+        self.search_results = None
+        
+        # Display strings for entries already formatted, keyed by (timestamp, text)
+        self.formatted_entries = {}
+        
+        # Screen areas that changed since the last frame
+        self.dirty = DirtyRects()
+        
         # Journal prompts
         self.journal_prompts = [
             "What made you feel proud today?",
@@ -49,15 +106,30 @@ class JournalScene:
             color=(240, 240, 230)  # Soft cream color
         )
         
+        # Fixed labels are rendered once; the prompt text whenever it changes
+        self.title_surf = self.game_manager.title_font.render("Journal", True, (50, 50, 50))
+        self.prompt_label_surf = self.game_manager.main_font.render("Prompt:", True, (50, 50, 50))
+        self.prompt_text = (None, None)
+        
         # Journal entries panel
         entries_width = panel_width // 3
         entries_height = panel_height - 80
         entries_x = panel_x + 20
         entries_y = panel_y + 60
         
+        # Search box above the entries, filtering them as you type
+        search_height = 30
+        self.search_input = TextInput(
+            entries_x, entries_y, entries_width, search_height,
+            self.game_manager.small_font,
+            placeholder="Search entries...",
+            max_length=50
+        )
+        
         self.entries_panel = MessagePanel(
-            entries_x, entries_y, entries_width, entries_height,
-            self.game_manager.small_font, "Your Journal Entries", self.game_manager.main_font,
+            entries_x, entries_y + search_height + 10, entries_width,
+            entries_height - search_height - 10,
+            self.game_manager.small_font, self.ENTRIES_TITLE, self.game_manager.main_font,
             color=(230, 230, 230)
         )
         
@@ -109,15 +181,15 @@ class JournalScene:
     
     def reset(self):
         """Reset scene state when returning to it"""
-        # Refresh entries list
-        journal_entries = self.game_manager.player_data.journal_entries
-        
-        # Format entries for display
-        formatted_entries = []
-        for entry in journal_entries:
-            formatted_entries.append(f"[{entry['date']}]\n{entry['text']}")
+        # Clear any search and refresh entries from the start of the journal
+        self.search_input.clear()
+        self.search_query = ""
+        self.search_results = None
+        self.entries_panel.title = self.ENTRIES_TITLE
+        self.refresh_entries()
         
-        self.entries_panel.set_messages(formatted_entries)
+        # Index the journal in the background so the first search is fast
+        self.game_manager.player_data.prepare_journal_search()
         
         # Reset input
         self.journal_input.clear()
@@ -125,6 +197,88 @@ class JournalScene:
         # Pick a random prompt
         self.new_prompt()
     
+    def refresh_entries(self):
+        """List the search matches, or the whole journal, in the entries panel from the top"""
+        player_data = self.game_manager.player_data
+        
+        if self.search_results is not None:
+            results = self.search_results
+            if not results:
+                self.entries_panel.set_messages([f"No entries match \"{self.search_query}\""])
+                return
+            entries = EntryList(len(results), lambda offset, limit: results[offset:offset + limit],
+                                self.format_entry)
+        else:
+            entries = EntryList(player_data.journal_count(), player_data.journal_page, self.format_entry)
+        self.entries_panel.set_messages(entries)
+            
+    def format_entry(self, entry):
+        """Display string for an entry, formatted once and then cached"""
+        key = (entry.timestamp, entry.text)
+        formatted = self.formatted_entries.get(key)
+        if formatted is None:
+            if len(self.formatted_entries) >= self.FORMAT_CACHE_LIMIT:
+                self.formatted_entries.clear()
+            formatted = self.formatted_entries[key] = f"[{entry.date}]\n{entry.text}"
+        return formatted
+    
+    def show_new_entry(self):
+        """Add a just-saved entry to the panel without moving the view"""
+        if self.search_query:
+            # Searches are cheap to rerun, and a date jump keeps its count current
+            self.search_entries(self.search_query)
+            return
+            
+        # The new entry goes at the end of the journal, which the panel reads on demand
+        self.entries_panel.messages.grow()
+        self.entries_panel.refresh()
+    
+    def search_entries(self, query):
+        """Filter the entries panel to entries containing query, or jump to a date"""
+        self.search_query = query
+        self.entries_panel.title = self.ENTRIES_TITLE
+        
+        date_match = self.DATE_QUERY.match(query)
+        if query and not date_match:
+            self.search_results = self.game_manager.player_data.search_journal(query)
+        else:
+            self.search_results = None
+        self.refresh_entries()
+        if date_match:
+            self.jump_to_date(query, *(int(part) if part else None for part in date_match.groups()))
+    
+    def jump_to_date(self, label, year, month=None, day=None):
+        """Scroll to the first entry of a year, month or day and show its entry count"""
+        try:
+            start_day, end_day = period_bounds(year, month, day)
+        except ValueError:
+            self.entries_panel.title = f"{label}: not a date"
+            return
+            
+        dates = self.game_manager.player_data.journal_dates
+        self.show_period(label, dates.count_between(start_day, end_day), dates.first_position(start_day))
+    
+    def step_day(self, direction):
+        """Jump to the previous (-1) or next (1) day that has entries"""
+        top = self.entries_panel.first_visible()
+        if self.search_results is not None or top is None:
+            return
+            
+        dates = self.game_manager.player_data.journal_dates
+        current = entry_day(self.game_manager.player_data.journal_page(top, 1)[0])
+        target = dates.next_day(current) if direction > 0 else dates.previous_day(current)
+        if target is None:
+            return
+            
+        label = datetime.date.fromordinal(target).isoformat()
+        self.show_period(label, dates.count_between(target, target + 1), dates.first_position(target))
+    
+    def show_period(self, label, count, position):
+        """Scroll the entries panel to position with a per-period count in the title"""
+        self.entries_panel.title = f"{label}: {count} {'entry' if count == 1 else 'entries'}"
+        if position is not None:
+            self.entries_panel.scroll_to(position)
+    
     def handle_event(self, event):
         """Handle pygame events"""
         mouse_pos = pygame.mouse.get_pos()
@@ -141,17 +295,47 @@ class JournalScene:
         # Handle scrolling in entries panel
         if event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 4:  # Scroll up
-                self.entries_panel.scroll(-1)
+                self.entries_panel.scroll_lines(-self.WHEEL_LINES)
             elif event.button == 5:  # Scroll down
-                self.entries_panel.scroll(1)
+                self.entries_panel.scroll_lines(self.WHEEL_LINES)
+                
+        # Page Up / Page Down jump between days that have entries
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_PAGEUP:
+                self.step_day(-1)
+            elif event.key == pygame.K_PAGEDOWN:
+                self.step_day(1)
         
-        # Update text input
+        # Update text inputs, searching again whenever the query changes
         self.journal_input.update(all_events)
+        query = self.search_input.update(all_events).strip()
+        if query != self.search_query:
+            self.search_entries(query)
     
-    def update(self):
-        """Update scene state"""
-        # Nothing to update regularly in this scene
-        pass
+    def update(self, dt):
+        """Update scene state by dt milliseconds"""
+        # Advance the cursor blink of the text inputs
+        self.journal_input.update([], dt)
+        self.search_input.update([], dt)
+    
+    def idle_timeout(self):
+        """Milliseconds until the scene changes without input (None: never, 0: animating)"""
+        # Only a focused input's blinking cursor changes on its own
+        blinks = [t for t in (self.journal_input.time_to_blink(), self.search_input.time_to_blink())
+                  if t is not None]
+        return min(blinks) if blinks else None
+    
+    def dirty_rects(self):
+        """Screen areas whose contents changed in the last draw"""
+        self.dirty.check_widgets([self.main_panel, self.search_input, self.entries_panel, self.journal_input,
+                                  self.save_button, self.prompt_button, self.back_button])
+        
+        # The prompt line above the journal input
+        prompt_x = self.journal_input.rect.left
+        prompt_y = self.journal_input.rect.top - 30
+        self.dirty.check('prompt', self.current_prompt,
+                         (prompt_x, prompt_y, self.main_panel.rect.right - prompt_x, 30))
+        return self.dirty.take()
     
     def draw(self, surface):
         """Draw the scene"""
@@ -159,20 +343,23 @@ class JournalScene:
         self.main_panel.draw(surface)
         
         # Draw title
-        title_surf = self.game_manager.title_font.render("Journal", True, (50, 50, 50))
-        title_rect = title_surf.get_rect(midtop=(self.screen_rect.centerx, self.main_panel.rect.top + 20))
-        surface.blit(title_surf, title_rect)
+        title_rect = self.title_surf.get_rect(midtop=(self.screen_rect.centerx, self.main_panel.rect.top + 20))
+        surface.blit(self.title_surf, title_rect)
         
-        # Draw entries panel
+        # Draw search box and entries panel
+        self.search_input.draw(surface)
         self.entries_panel.draw(surface)
         
         # Draw current prompt
-        prompt_surf = self.game_manager.main_font.render("Prompt:", True, (50, 50, 50))
+        prompt_surf = self.prompt_label_surf
         prompt_x = self.journal_input.rect.left
-        prompt_y = self.entries_panel.rect.top - 30
+        prompt_y = self.journal_input.rect.top - 30
         surface.blit(prompt_surf, (prompt_x, prompt_y))
         
-        prompt_text_surf = self.game_manager.small_font.render(self.current_prompt, True, (50, 50, 150))
+        if self.prompt_text[0] != self.current_prompt:
+            self.prompt_text = (self.current_prompt,
+                                self.game_manager.small_font.render(self.current_prompt, True, (50, 50, 150)))
+        prompt_text_surf = self.prompt_text[1]
         surface.blit(prompt_text_surf, (prompt_x + prompt_surf.get_width() + 10, prompt_y + 5))
         
         # Draw text input
@@ -195,9 +382,10 @@ class JournalScene:
             if 'click' in self.game_manager.sounds:
                 self.game_manager.sounds['click'].play()
             
-            # Reset input and refresh entries
+            # Reset input and show the new entry (the rest of the panel is unchanged)
             self.journal_input.clear()
-            self.reset()
+            self.new_prompt()
+            self.show_new_entry()
     
     def new_prompt(self):
         """Get a new random journal prompt"""
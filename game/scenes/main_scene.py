@@ -1,9 +1,9 @@
 import pygame
 import random
-import math
 from ..ui.button import Button
 from ..ui.panel import MessagePanel
 from ..plant_renderer import PlantRenderer
+from ..particles import SparkleField
 
 class MainScene:
     """Main game scene with the plant and core interactions"""
@@ -18,9 +18,6 @@ class MainScene:
         # Track time for animations
         self.elapsed_time = 0
         
-        # Initialize UI elements
-        self.create_ui()
-        
         # Motivational quotes
         self.quotes = [
             "Believe in yourself. You are braver than you think, more talented than you know.",
@@ -40,10 +37,14 @@ class MainScene:
             "Your worth is not measured by your productivity."
         ]
         
+        # Initialize UI elements (the quote panel needs the quotes above)
+        self.create_ui()
+        
         # Animation variables
         self.water_effect_active = False
         self.water_timer = 0
-        self.sparkle_positions = []
+        self.sparkles = SparkleField(self.screen_rect)
+        self.sparkle_count = 20
         
     def create_ui(self):
         """Create UI elements"""
@@ -92,7 +93,7 @@ class MainScene:
             quote_x, quote_y, quote_width, quote_height,
             self.game_manager.small_font,
             color=(230, 230, 250, 200),  # Light purple with transparency
-            text_color=(50, 50, 50)
+            text_color=(50, 50, 50), prerender=True
         )
         
         # Set initial quote
@@ -108,7 +109,7 @@ class MainScene:
             message_x, message_y, message_width, message_height,
             self.game_manager.small_font, "Growth Journal", self.game_manager.main_font,
             color=(220, 240, 220, 220),  # Light green with transparency
-            text_color=(50, 50, 50)
+            text_color=(50, 50, 50), prerender=True
         )
     
     def update_messages_panel(self):
@@ -121,19 +122,14 @@ class MainScene:
         """Reset the scene state when returning to it"""
         self.update_messages_panel()
         self.water_effect_active = False
-        self.plant_renderer.water_particles = []
+        self.plant_renderer.water_particles.clear()
         
         # Update quote randomly
         if random.random() < 0.3:  # 30% chance to get a new quote
             self.quote_panel.set_messages([random.choice(self.quotes)])
         
-        # Create some random sparkle positions
-        self.sparkle_positions = [
-            (random.randint(0, self.screen_rect.width),
-             random.randint(0, self.screen_rect.height),
-             random.uniform(0.5, 2.0))  # size
-            for _ in range(20)
-        ]
+        # Scatter fresh sparkles
+        self.sparkles.reset(self.sparkle_count)
     
     def handle_event(self, event):
         """Handle pygame events"""
@@ -148,13 +144,12 @@ class MainScene:
         # Handle scrolling in message panel
         if event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 4:  # Scroll up
-                self.messages_panel.scroll(-1)
+                self.messages_panel.scroll_lines(-1)
             elif event.button == 5:  # Scroll down
-                self.messages_panel.scroll(1)
+                self.messages_panel.scroll_lines(1)
     
-    def update(self):
-        """Update scene state"""
-        dt = pygame.time.get_ticks() % 60  # Time since last frame in ms
+    def update(self, dt):
+        """Update scene state by dt milliseconds"""
         self.elapsed_time += dt
         
         # Update plant animations
@@ -166,11 +161,18 @@ class MainScene:
             if self.water_timer <= 0:
                 self.water_effect_active = False
         
-        # Update sparkle animations
-        for i, (x, y, size) in enumerate(self.sparkle_positions):
-            # Move sparkles slowly
-            new_y = (y - 0.2 * dt) % self.screen_rect.height
-            self.sparkle_positions[i] = (x, new_y, size)
+        # Move sparkles slowly
+        self.sparkles.update(dt)
+    
+    def idle_timeout(self):
+        """Milliseconds until the scene changes without input (None: never, 0: animating)"""
+        # The plant sways and the sparkles drift every frame
+        return 0
+    
+    def dirty_rects(self):
+        """Screen areas whose contents changed in the last draw (None: all of it)"""
+        # Sparkles drift across the whole screen
+        return None
     
     def draw(self, surface):
         """Draw the scene"""
@@ -199,18 +201,8 @@ class MainScene:
     
     def _draw_background(self, surface):
         """Draw background elements like sparkles and clouds"""
-        # Draw some background sparkles
-        for x, y, size in self.sparkle_positions:
-            # Make sparkles twinkle
-            alpha = int(150 + 105 * abs(math.sin(self.elapsed_time * 0.001 + x * 0.1)))
-            sparkle_color = (255, 255, 200, alpha)
-            
-            pygame.draw.circle(
-                surface,
-                sparkle_color,
-                (int(x), int(y)),
-                int(size)
-            )
+        # Draw some twinkling background sparkles
+        self.sparkles.draw(surface, self.elapsed_time)
     
     def _draw_status_indicators(self, surface):
         """Draw indicators for daily activities"""
@@ -0,0 +1,164 @@
+from .journal_log import JournalLog
+from .journal_entry import JournalEntry
+from .save_writer import SaveWriter
+from .persistence import PersistenceEngine
+from .journal_dates import JournalDateIndex
+
+class SnapshotStore:
+    """File based storage backend for PlayerData.
+    
+    The scalar state is kept as a binary snapshot plus a write-ahead log of
+    ops, and journal entries live in an append-only log with an offset
+    index.
+    """
+    
+    def __init__(self, save_file='player_data.sav', wal_file='player_data.wal',
+                 journal_file='journal_log.jsonl', journal_index_file='journal_log.idx',
+                 legacy_save_file='player_data.json'):
+        self.save_file = save_file
+        self.wal_file = wal_file
+        self.legacy_save_file = legacy_save_file
+        
+        # Saves are written (and appends fsynced) on a background thread so
+        # disk I/O never stalls a frame
+        self.writer = SaveWriter()
+        
+        # Journal entries live in their own append-only log so adding one
+        # never rewrites the rest of the save
+        self.journal_log = JournalLog(journal_file, journal_index_file, self.writer)
+        
+        # Sorted by-day index for jumping to dates, caught up on each use
+        self._journal_dates = JournalDateIndex()
+        
+        # Mutations are appended to a WAL and compacted into the save file
+        # every so often, so the common write path is a tiny append
+        self.persistence = PersistenceEngine(self.save_file, self.wal_file, self.writer,
+                                             legacy_snapshot_file=self.legacy_save_file)
+        
+        # Set when an old JSON save was loaded and should be rewritten in the current format
+        self.needs_rewrite = False
+    
+    def load(self):
+        """Return the saved state (or None) and the ops to replay on top of it"""
+        # Older saves kept the journal inline, stream it into the log. The
+        # inline copy is only dropped once the snapshot is rewritten, after
+        # every entry is in the log, so an interrupted migration is resumed:
+        # entries already in the log are skipped and the rest appended.
+        migrated = len(self.journal_log)
+        position = 0
+        batch = []
+        
+        def migrate_entry(entry):
+            nonlocal position
+            self.needs_rewrite = True
+            if position >= migrated:
+                batch.append(JournalEntry.from_dict(entry))
+                if len(batch) >= 1000:
+                    self.journal_log.extend(batch)
+                    batch.clear()
+            position += 1
+                    
+        try:
+            data, ops = self.persistence.load(on_journal_entry=migrate_entry)
+            if batch:
+                self.journal_log.extend(batch)
+            if self.persistence.loaded_legacy:
+                self.needs_rewrite = True
+        finally:
+            # Journal entries are only needed by the journal scene, so parse
+            # them off the main thread instead of before the first frame
+            self.journal_log.load_in_background()
+            
+        return data, ops
+    
+    def record(self, op, state):
+        """Persist a single op, compacting into a snapshot when it is time to"""
+        self.persistence.append(op)
+        if self.persistence.needs_snapshot():
+            self.save(state)
+    
+    def save(self, state):
+        """Write a full snapshot of the scalar state"""
+        self.persistence.snapshot(state)
+    
+    def append_journal(self, entry):
+        self.journal_log.append(entry)
+    
+    def journal_entries(self):
+        return self.journal_log.entries()
+    
+    def journal_count(self):
+        return len(self.journal_log)
+    
+    def journal_page(self, offset, limit):
+        if self.journal_log.is_loaded():
+            return self.journal_entries()[offset:offset + limit]
+        # Seek straight to the page instead of waiting for the full load
+        return self.journal_log.read_range(offset, offset + limit)
+    
+    def journal_dates(self):
+        self._journal_dates.update(self.journal_entries())
+        return self._journal_dates
+    
+    def has_pending_ops(self):
+        return self.persistence.ops_since_snapshot > 0
+    
+    def close(self):
+        self.writer.close()
+        self.persistence.close()
+
+class SnapshotReader:
+    """Read-only view of a SnapshotStore save, for copying it elsewhere.
+    
+    Loading reads the snapshot, WAL and journal log without writing,
+    compacting or repairing any of them, and record/save are no-ops, so a
+    PlayerData built on it leaves the files exactly as they were.
+    """
+    
+    def __init__(self, save_file='player_data.sav', wal_file='player_data.wal',
+                 journal_file='journal_log.jsonl', legacy_save_file='player_data.json'):
+        self.journal_file = journal_file
+        self.persistence = PersistenceEngine(save_file, wal_file, None,
+                                             legacy_snapshot_file=legacy_save_file)
+        self.entries = []
+        self._journal_dates = JournalDateIndex()
+        self.needs_rewrite = False
+    
+    def load(self):
+        """Return the saved state (or None) and the ops to replay on top of it"""
+        # Same journal as SnapshotStore sees: the log, then any inline
+        # entries an interrupted migration hadn't copied into it yet
+        self.entries = JournalLog.read_file(self.journal_file)
+        migrated = len(self.entries)
+        inline = []
+        data, ops = self.persistence.load(on_journal_entry=inline.append)
+        self.entries.extend(JournalEntry.from_dict(entry) for entry in inline[migrated:])
+        return data, ops
+    
+    def record(self, op, state):
+        pass
+    
+    def save(self, state):
+        pass
+    
+    def append_journal(self, entry):
+        self.entries.append(entry)
+    
+    def journal_entries(self):
+        return self.entries
+    
+    def journal_count(self):
+        return len(self.entries)
+    
+    def journal_page(self, offset, limit):
+        return self.entries[offset:offset + limit]
+    
+    def journal_dates(self):
+        self._journal_dates.update(self.entries)
+        return self._journal_dates
+    
+    def has_pending_ops(self):
+        return False
+    
+    def close(self):
+        pass
@@ -0,0 +1,200 @@
+import sqlite3
+import threading
+from .journal_entry import JournalEntry
+from .journal_dates import timestamp_day, day_start
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS player_state (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    plant_level INTEGER NOT NULL,
+    plant_growth REAL NOT NULL,
+    last_login TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS daily_activity (
+    day TEXT PRIMARY KEY,
+    watered INTEGER NOT NULL DEFAULT 0,
+    affirmation_done INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS unlocked_messages (
+    id INTEGER PRIMARY KEY,
+    text TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS journal_entries (
+    id INTEGER PRIMARY KEY,
+    ts INTEGER NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_journal_entries_ts ON journal_entries (ts);
+"""
+
+class SQLiteStore:
+    """SQLite storage backend for PlayerData.
+    
+    The scalar state, daily activity, unlocked messages and journal entries
+    (indexed by timestamp) each live in their own table. Every op and every
+    journal entry is written as one small transaction, and the journal can
+    be read a page at a time instead of being held in memory.
+    
+    The connection belongs to the thread that opened the store. The full
+    entry list may also be requested from a background thread (the search
+    indexer), so it is read through a connection of its own.
+    """
+    
+    def __init__(self, db_file='player_data.db'):
+        self.db_file = db_file
+        self.conn = sqlite3.connect(db_file)
+        self.conn.executescript(SCHEMA)
+        self._entries = None
+        # Guards _entries and the journal writes that keep it in step
+        self._journal_lock = threading.Lock()
+        self._journal_dates = SQLiteDateIndex(self.conn)
+        
+        # Saves created from scratch need no rewrite on load
+        self.needs_rewrite = False
+    
+    def is_empty(self):
+        """Whether no player state has been stored yet"""
+        return self.conn.execute("SELECT 1 FROM player_state").fetchone() is None
+    
+    def load(self):
+        """Return the saved state (or None); SQLite writes are never replayed"""
+        row = self.conn.execute(
+            "SELECT plant_level, plant_growth, last_login FROM player_state WHERE id = 1"
+        ).fetchone()
+        if row is None:
+            return None, []
+            
+        plant_level, plant_growth, last_login = row
+        activity = self.conn.execute(
+            "SELECT watered, affirmation_done FROM daily_activity WHERE day = ?",
+            (last_login,)
+        ).fetchone() or (0, 0)
+        messages = [text for (text,) in self.conn.execute(
+            "SELECT text FROM unlocked_messages ORDER BY id")]
+            
+        data = {
+            'plant_level': plant_level,
+            'plant_growth': plant_growth,
+            'watered_today': bool(activity[0]),
+            'affirmation_done_today': bool(activity[1]),
+            'unlocked_messages': messages,
+            'last_login': last_login
+        }
+        return data, []
+    
+    def record(self, op, state):
+        """Persist the state after an op in a single transaction"""
+        self.save(state)
+    
+    def save(self, state):
+        """Write the scalar state, today's activity and any new messages"""
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO player_state (id, plant_level, plant_growth, last_login) "
+                "VALUES (1, ?, ?, ?)",
+                (state['plant_level'], state['plant_growth'], state['last_login'])
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO daily_activity (day, watered, affirmation_done) "
+                "VALUES (?, ?, ?)",
+                (state['last_login'], int(state['watered_today']), int(state['affirmation_done_today']))
+            )
+            
+            # Messages are only ever appended, so store whatever is past the end
+            stored = self.conn.execute("SELECT COUNT(*) FROM unlocked_messages").fetchone()[0]
+            self.conn.executemany(
+                "INSERT INTO unlocked_messages (text) VALUES (?)",
+                [(text,) for text in state['unlocked_messages'][stored:]]
+            )
+    
+    def append_journal(self, entry):
+        with self._journal_lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO journal_entries (ts, text) VALUES (?, ?)",
+                (entry.timestamp, entry.text)
+            )
+            if self._entries is not None:
+                self._entries.append(entry)
+    
+    def extend_journal(self, entries):
+        """Insert many entries in one transaction (used when migrating)"""
+        with self._journal_lock, self.conn:
+            self.conn.executemany(
+                "INSERT INTO journal_entries (ts, text) VALUES (?, ?)",
+                [(entry.timestamp, entry.text) for entry in entries]
+            )
+            self._entries = None
+    
+    def journal_entries(self):
+        """Every journal entry, oldest first (safe to call from any thread)"""
+        with self._journal_lock:
+            if self._entries is None:
+                conn = sqlite3.connect(self.db_file)
+                try:
+                    rows = conn.execute("SELECT ts, text FROM journal_entries ORDER BY id")
+                    self._entries = [JournalEntry(ts, text) for ts, text in rows]
+                finally:
+                    conn.close()
+            return self._entries
+    
+    def journal_count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM journal_entries").fetchone()[0]
+    
+    def journal_page(self, offset, limit):
+        rows = self.conn.execute(
+            "SELECT ts, text FROM journal_entries ORDER BY id LIMIT ? OFFSET ?",
+            (limit, offset)
+        )
+        return [JournalEntry(ts, text) for ts, text in rows]
+    
+    def journal_dates(self):
+        return self._journal_dates
+    
+    def has_pending_ops(self):
+        return False
+    
+    def close(self):
+        self.conn.close()
+
+class SQLiteDateIndex:
+    """JournalDateIndex lookups answered by the journal's timestamp index.
+    
+    Nothing is held in memory; each lookup is a query or two on
+    idx_journal_entries_ts, so jumping to a date never loads the journal.
+    """
+    
+    def __init__(self, conn):
+        self.conn = conn
+    
+    def count_between(self, start_day, end_day):
+        """Number of entries on days in [start_day, end_day)"""
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM journal_entries WHERE ts >= ? AND ts < ?",
+            (day_start(start_day), day_start(end_day))
+        ).fetchone()[0]
+    
+    def first_position(self, start_day):
+        """Position of the earliest entry on or after start_day (the last entry if none)"""
+        row = self.conn.execute(
+            "SELECT id FROM journal_entries WHERE ts >= ? ORDER BY ts, id LIMIT 1",
+            (day_start(start_day),)
+        ).fetchone() or self.conn.execute(
+            "SELECT id FROM journal_entries ORDER BY ts DESC, id DESC LIMIT 1"
+        ).fetchone()
+        if row is None:
+            return None
+        return self.conn.execute("SELECT COUNT(*) FROM journal_entries WHERE id < ?", row).fetchone()[0]
+    
+    def next_day(self, day):
+        """The first day after day that has entries, or None"""
+        ts = self.conn.execute(
+            "SELECT MIN(ts) FROM journal_entries WHERE ts >= ?", (day_start(day + 1),)
+        ).fetchone()[0]
+        return None if ts is None else timestamp_day(ts)
+    
+    def previous_day(self, day):
+        """The last day before day that has entries, or None"""
+        ts = self.conn.execute(
+            "SELECT MAX(ts) FROM journal_entries WHERE ts < ?", (day_start(day),)
+        ).fetchone()[0]
+        return None if ts is None else timestamp_day(ts)
@@ -0,0 +1,92 @@
+from collections import OrderedDict
+
+class TextRenderCache:
+    """LRU cache of rendered text surfaces shared by every font in the game.
+    
+    Surfaces are keyed on (font, text, antialias, color, background), so
+    labels drawn every frame are only rasterized once. The returned surfaces
+    are shared between callers and must not be drawn on. The cache is
+    bounded by both entry count and total pixel bytes, since one long line
+    of text can be hundreds of KB.
+    """
+    
+    def __init__(self, max_entries=512, max_bytes=8 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.surfaces = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+    
+    def __len__(self):
+        return len(self.surfaces)
+    
+    def render(self, font, text, antialias, color, background=None):
+        """font.render(text, antialias, color, background), served from the cache when possible"""
+        key = (font, text, bool(antialias), _color_key(color), _color_key(background))
+        cached = self.surfaces.get(key)
+        if cached is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return cached
+            
+        self.misses += 1
+        if background is None:
+            cached = font.render(text, antialias, color)
+        else:
+            cached = font.render(text, antialias, color, background)
+        size = _surface_bytes(cached)
+        if size > self.max_bytes:
+            return cached  # Too big to keep; caching it would flush everything else
+            
+        self.surfaces[key] = cached
+        self.bytes += size
+        while len(self.surfaces) > self.max_entries or self.bytes > self.max_bytes:
+            _, evicted = self.surfaces.popitem(last=False)  # Evict the least recently used
+            self.bytes -= _surface_bytes(evicted)
+        return cached
+    
+    def clear(self):
+        """Drop every cached surface and reset the counters"""
+        self.surfaces.clear()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+def _surface_bytes(surface):
+    """Pixel memory held by a surface"""
+    return surface.get_pitch() * surface.get_height()
+
+def _color_key(color):
+    """Hashable form of a color given as a tuple, list, pygame.Color or name"""
+    if color is None or isinstance(color, (tuple, str)):
+        return color
+    return tuple(color)
+
+# The cache shared by the whole process
+text_cache = TextRenderCache()
+
+class CachedFont:
+    """Wraps a pygame Font so render() goes through the shared text cache.
+    
+    Everything else (size, get_height, metrics...) is passed straight to
+    the wrapped font.
+    """
+    
+    def __init__(self, font, cache=None):
+        self.font = font
+        self.cache = cache if cache is not None else text_cache
+    
+    def render(self, text, antialias, color, background=None):
+        return self.cache.render(self.font, text, antialias, color, background)
+    
+    def __getattr__(self, name):
+        return getattr(self.font, name)
+
+def cached_font(font):
+    """font wrapped in a CachedFont, unless it already is one"""
+    return font if isinstance(font, CachedFont) else CachedFont(font)
+
+def uncached_font(font):
+    """The font underneath a CachedFont, for text that changes too often to cache"""
+    return font.font if isinstance(font, CachedFont) else font
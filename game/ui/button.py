@@ -1,13 +1,15 @@
 import pygame
+from .widget import Widget
+from ..text_cache import cached_font
 
-class Button:
+class Button(Widget):
     """Interactive button UI component with Minecraft-inspired style"""
     
     def __init__(self, x, y, width, height, text, font, action=None, 
                  hover_color=(158, 214, 125), color=(100, 180, 100), text_color=(255, 255, 255)):
         self.rect = pygame.Rect(x, y, width, height)
         self.text = text
-        self.font = font
+        self.font = cached_font(font)
         self.action = action
         self.color = color
         self.hover_color = hover_color
@@ -19,16 +21,17 @@ class Button:
         self.shadow_offset = 4
         self.pressed = False
     
-    def draw(self, surface):
+    def render(self, surface):
+        # Drawn relative to the cached surface, which starts at the button's top left
         # Draw button shadow (3D effect)
-        shadow_rect = pygame.Rect(self.rect.x, self.rect.y + self.shadow_offset, 
+        shadow_rect = pygame.Rect(0, self.shadow_offset, 
                                  self.rect.width, self.rect.height)
         pygame.draw.rect(surface, (30, 30, 30), shadow_rect)  # Dark shadow
         
         # Draw main button
         current_color = self.hover_color if self.hovered else self.color
         offset = 2 if self.pressed else 0
-        button_rect = pygame.Rect(self.rect.x, self.rect.y + offset, 
+        button_rect = pygame.Rect(0, offset, 
                                  self.rect.width, self.rect.height)
         
         pygame.draw.rect(surface, current_color, button_rect)  # Button fill
@@ -54,6 +57,16 @@ class Button:
         
         return False
 
+    def draw_state(self):
+        """Everything that affects how the button looks"""
+        return (tuple(self.rect), self.text, self.hovered, self.pressed,
+                self.color, self.hover_color, self.text_color)
+    
+    def draw_rect(self):
+        """Screen area the button draws into, including its shadow"""
+        return pygame.Rect(self.rect.x, self.rect.y, self.rect.width,
+                           self.rect.height + max(self.shadow_offset, 2))
+
 class TextButton(Button):
     """Text-only button variant with subtle highlighting"""
     
@@ -71,9 +84,17 @@ class TextButton(Button):
         self.border_size = 0
         self.shadow_offset = 2
     
-    def draw(self, surface):
+    def new_surface(self):
+        """A fully transparent surface, so anti-aliased text edges keep their alpha"""
+        layer = pygame.Surface(self.draw_rect().size, pygame.SRCALPHA)
+        layer.fill((0, 0, 0, 0))
+        return layer
+    
+    def render(self, surface):
         # Text-only buttons just draw the text with a hover effect
         current_color = self.hover_color if self.hovered else self.color
         text_surf = self.font.render(self.text, True, current_color)
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        surface.blit(text_surf, text_rect)
+        text_rect = text_surf.get_rect(center=(self.rect.width // 2, self.rect.height // 2))
+
+        # Copy the text's pixels as-is; blending onto the clear surface would darken its edges
+        surface.blit(text_surf, text_rect, special_flags=pygame.BLEND_RGBA_MAX)
@@ -0,0 +1,34 @@
+import pygame
+
+class DirtyRects:
+    """Tracks which screen areas changed between frames.
+
+    Each tracked item is checked after drawing with a state value that
+    captures everything affecting how it looks. When the state differs from
+    the previous frame, the item's screen area is marked dirty, so the main
+    loop only has to push those areas to the display.
+    """
+
+    def __init__(self):
+        self.states = {}
+        self.rects = []
+
+    def check(self, key, state, rect):
+        """Mark rect dirty if key's state changed since the last check"""
+        if self.states.get(key, self) != state:
+            self.states[key] = state
+            self.rects.append(pygame.Rect(rect))
+
+    def check_widgets(self, widgets):
+        """Check each widget by its draw_state() and draw_rect()"""
+        for widget in widgets:
+            self.check(widget, widget.draw_state(), widget.draw_rect())
+
+    def take(self):
+        """Return the dirty rects collected since the last call and start over"""
+        rects, self.rects = self.rects, []
+
+        # Drop rects already covered by another one (like widgets inside a redrawn panel)
+        return [rect for i, rect in enumerate(rects)
+                if not any(other.contains(rect) and (other != rect or j < i)
+                           for j, other in enumerate(rects) if j != i)]
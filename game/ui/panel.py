@@ -1,7 +1,12 @@
+import bisect
+from collections import OrderedDict
 import pygame
+from .widget import Widget
+from ..text_cache import cached_font
+from .text_layout import wrap_message
 
-class Panel:
-    """A Minecraft-styled panel with 3D borders"""
+class Panel(Widget):
+    """A Minecraft-styled panel with 3D borders, cached until its look changes"""
     
     def __init__(self, x, y, width, height, color=(200, 200, 200), border_color=(50, 50, 50)):
         self.rect = pygame.Rect(x, y, width, height)
@@ -10,140 +15,306 @@ class Panel:
         self.border_size = 4
         self.shadow_offset = 6
     
-    def draw(self, surface):
+    def render(self, surface):
+        # Drawn relative to the cached surface, which starts at the panel's top left
+        rect = pygame.Rect(0, 0, self.rect.width, self.rect.height)
+        
         # Draw shadow for 3D effect
-        shadow_rect = pygame.Rect(self.rect.x + self.shadow_offset, 
-                                 self.rect.y + self.shadow_offset,
+        shadow_rect = pygame.Rect(self.shadow_offset, self.shadow_offset,
                                  self.rect.width, self.rect.height)
         pygame.draw.rect(surface, (20, 20, 20, 100), shadow_rect, border_radius=2)  # Shadow
         
         # Draw panel background
-        pygame.draw.rect(surface, self.color, self.rect, border_radius=2)  # Main panel
+        pygame.draw.rect(surface, self.color, rect, border_radius=2)  # Main panel
         
         # Draw borders - Minecraft style with darker edges
         # Top and left borders (lighter)
         pygame.draw.line(surface, (255, 255, 255, 150), 
-                         (self.rect.left, self.rect.top), 
-                         (self.rect.right, self.rect.top), 2)  # Top
+                         (rect.left, rect.top), 
+                         (rect.right, rect.top), 2)  # Top
         pygame.draw.line(surface, (255, 255, 255, 150), 
-                         (self.rect.left, self.rect.top), 
-                         (self.rect.left, self.rect.bottom), 2)  # Left
+                         (rect.left, rect.top), 
+                         (rect.left, rect.bottom), 2)  # Left
         
         # Bottom and right borders (darker)
         pygame.draw.line(surface, self.border_color, 
-                         (self.rect.left, self.rect.bottom-1), 
-                         (self.rect.right, self.rect.bottom-1), 2)  # Bottom
+                         (rect.left, rect.bottom-1), 
+                         (rect.right, rect.bottom-1), 2)  # Bottom
         pygame.draw.line(surface, self.border_color, 
-                         (self.rect.right-1, self.rect.top), 
-                         (self.rect.right-1, self.rect.bottom), 2)  # Right
+                         (rect.right-1, rect.top), 
+                         (rect.right-1, rect.bottom), 2)  # Right
+
+    def draw_state(self):
+        """Everything that affects how the panel looks"""
+        return (tuple(self.rect), self.color, self.border_color)
+    
+    def draw_rect(self):
+        """Screen area the panel draws into, including its shadow"""
+        return pygame.Rect(self.rect.x, self.rect.y, self.rect.width + self.shadow_offset,
+                           self.rect.height + self.shadow_offset)
 
 class MessagePanel(Panel):
-    """A panel with text content and optional title"""
+    """A panel with text content and optional title, scrolled by the pixel.
+    
+    The messages can be any sequence (len and indexing), such as a view of a
+    journal read on demand, and only the messages on screen are laid out.
+    Message heights are measured as scrolling reaches them and kept as
+    running totals from an anchor message, in both directions, so the
+    message at the top of the view is found by bisect and scrolling costs
+    the same however long the list is. Messages may be appended, but not
+    changed in place.
+    
+    With prerender, the whole wrapped list is drawn once into an off-screen
+    surface (or into tiles, past memory_limit bytes) that scrolling blits
+    from, for short lists that rarely change.
+    """
+    
+    # Messages whose wrapped lines are kept between draws
+    WRAP_CACHE_LIMIT = 2000
+    
+    # Pre-rendered content bigger than the memory limit (in bytes) is kept as tiles this tall
+    CONTENT_MEMORY_LIMIT = 4 * 1024 * 1024
+    CONTENT_TILE_HEIGHT = 256
     
     def __init__(self, x, y, width, height, font, title=None, title_font=None, 
-                 color=(200, 200, 200), text_color=(20, 20, 20)):
+                 color=(200, 200, 200), text_color=(20, 20, 20), prerender=False, memory_limit=None):
         super().__init__(x, y, width, height, color)
-        self.font = font
-        self.title_font = title_font if title_font else font
+        self.font = cached_font(font)
+        self.title_font = cached_font(title_font) if title_font else self.font
         self.title = title
         self.text_color = text_color
         self.messages = []
         self.padding = 15
         self.line_spacing = 5
+        self.version = 0  # Bumped whenever the messages change
         
-        # For scrolling long message lists
-        self.scroll_offset = 0
-        self.max_visible_lines = 0
-        self.calculate_visible_lines()
-    
-    def calculate_visible_lines(self):
-        """Calculate how many lines can be displayed at once"""
-        available_height = self.rect.height - 2 * self.padding
-        if self.title:
-            title_height = self.title_font.render(self.title, True, self.text_color).get_height()
-            available_height -= title_height + self.line_spacing * 2
+        # Wrapped lines for each message text, valid while the wrap width stays the same
+        self.wrapped = {}
+        self.wrap_width = None
+    
+        # Scroll position, measured from the top of the anchor message
+        self.anchor = 0
+        self.scroll_y = 0
+        self.tops = [0]  # tops[k]: top of message anchor + k (the last one is the bottom of the measured run)
+        self.depths = []  # depths[k]: how far above the anchor message anchor - 1 - k starts
         
-        line_height = self.font.render("Test", True, self.text_color).get_height()
-        self.max_visible_lines = available_height // (line_height + self.line_spacing)
+        # For lists that rarely change: all of the wrapped text drawn off-screen once,
+        # so scrolling only blits the part in view
+        self.prerender = prerender
+        self.memory_limit = memory_limit if memory_limit is not None else self.CONTENT_MEMORY_LIMIT
+        self.content_tiles = OrderedDict()
+        self.content_key = None
     
     def set_messages(self, messages):
-        """Set the list of messages to display"""
+        """Set the sequence of messages to display (kept, not copied) and scroll to the top"""
         self.messages = messages
-        self.scroll_offset = 0  # Reset scroll position
+        self.version += 1
+        self.scroll_to(0)
     
     def add_message(self, message):
         """Add a single message to the panel"""
         self.messages.append(message)
+        self.version += 1
+    
+    def refresh(self):
+        """Redraw after messages were appended to the sequence by its owner"""
+        self.version += 1
+    
+    def scroll(self, pixels):
+        """Scroll the messages by pixels (negative scrolls up)"""
+        self.scroll_y += pixels
+        self.clamp_scroll()
+    
+    def scroll_lines(self, lines):
+        """Scroll the messages by a number of text lines"""
+        self.scroll(lines * (self.font.get_height() + self.line_spacing))
+    
+    def scroll_to(self, index):
+        """Scroll so message index is at the top of the view (or as close as the list allows)"""
+        self.anchor = max(0, min(index, len(self.messages)))
+        self.scroll_y = 0
+        self.tops = [0]
+        self.depths = []
+        self.clamp_scroll()
+    
+    def first_visible(self):
+        """Index of the message at the top of the view, or None when there are none"""
+        index, _ = self.find_message(self.scroll_y)
+        return index if index < len(self.messages) else None
+    
+    def content_rect(self):
+        """Area the messages scroll through, relative to the panel's top left"""
+        top = self.padding
+        if self.title:
+            top += self.title_font.size(self.title)[1] + self.line_spacing * 2
+        return pygame.Rect(self.padding, top, self.rect.width - 2 * self.padding,
+                           max(0, self.rect.height - self.padding - top))
+    
+    def wrapped_lines(self, message):
+        """(text, height) lines of a message at the panel's width, wrapped once and cached"""
+        lines = self.wrapped.get(message)
+        if lines is None:
+            if len(self.wrapped) >= self.WRAP_CACHE_LIMIT:
+                self.wrapped.clear()
+            lines = self.wrapped[message] = wrap_message(self.font, message, self.wrap_width)
+        return lines
     
-    def scroll(self, amount):
-        """Scroll the message panel"""
-        max_offset = max(0, len(self.messages) - self.max_visible_lines)
-        self.scroll_offset = max(0, min(self.scroll_offset + amount, max_offset))
+    def message_height(self, index):
+        """Height of a message's wrapped lines, with the spacing after each line and message"""
+        lines = self.wrapped_lines(self.messages[index])
+        return sum(height for _, height in lines) + self.line_spacing * (len(lines) + 1)
     
-    def draw(self, surface):
+    def check_wrap_width(self):
+        """Re-wrap and re-measure everything if the panel width changed"""
+        width = self.rect.width - 2 * self.padding
+        if width != self.wrap_width:
+            self.wrapped.clear()
+            self.wrap_width = width
+            self.tops = [0]
+            self.depths = []
+            self.scroll_y = 0
+            
+    def measure_down(self, y):
+        """Measure messages below the anchor until their tops reach y or the list ends"""
+        tops = self.tops
+        index = self.anchor + len(tops) - 1
+        count = len(self.messages)
+        while tops[-1] < y and index < count:
+            tops.append(tops[-1] + self.message_height(index))
+            index += 1
+        return index >= count  # Whether the bottom of the list is measured
+    
+    def measure_up(self, y):
+        """Measure messages above the anchor until they reach up to y (negative) or the list starts"""
+        depths = self.depths
+        index = self.anchor - len(depths) - 1
+        depth = depths[-1] if depths else 0
+        while depth < -y and index >= 0:
+            depth += self.message_height(index)
+            depths.append(depth)
+            index -= 1
+        return index < 0  # Whether the top of the list is measured
+    
+    def clamp_scroll(self):
+        """Keep the view within the messages, measuring as far as it reaches"""
+        self.check_wrap_width()
+        view_height = self.content_rect().height
+        if self.measure_down(self.scroll_y + view_height):
+            self.scroll_y = min(self.scroll_y, self.tops[-1] - view_height)
+        if self.measure_up(self.scroll_y):
+            self.scroll_y = max(self.scroll_y, -(self.depths[-1] if self.depths else 0))
+    
+    def find_message(self, y):
+        """(index, top) of the measured message covering position y, found by bisect"""
+        if y >= 0 or not self.depths:
+            k = max(0, bisect.bisect_right(self.tops, y) - 1)
+            return self.anchor + k, self.tops[k]
+        k = min(bisect.bisect_left(self.depths, -y), len(self.depths) - 1)
+        return self.anchor - 1 - k, -self.depths[k]
+    
+    def line_blits(self, index, y, top, bottom, x):
+        """(surface, position) blits for the lines from message index on, starting at y, between top and bottom"""
+        blits = []
+        while y < bottom and index < len(self.messages):
+            for line, height in self.wrapped_lines(self.messages[index]):
+                if line and y + height > top:
+                    blits.append((self.font.render(line, True, self.text_color), (x, y)))
+                y += height + self.line_spacing
+                
+            # Add extra spacing between messages
+            y += self.line_spacing
+            index += 1
+        return blits
+    
+    def blit_content(self, surface, view):
+        """Draw the part of the pre-rendered content in view, rendering it first if it changed"""
+        # Every message is measured, so content positions start at the top of the first one
+        self.measure_down(float('inf'))
+        self.measure_up(float('-inf'))
+        origin = self.depths[-1] if self.depths else 0
+        total = origin + self.tops[-1]
+        
+        key = (self.version, len(self.messages), self.wrap_width, self.color, self.text_color)
+        if key != self.content_key:
+            self.content_tiles.clear()
+            self.content_key = key
+            
+        # One surface for all of it, or tiles rendered as they scroll into view if that's too big
+        width = max(1, self.rect.width - self.padding - self.border_size)
+        bytes_per_row = width * surface.get_bytesize()
+        if bytes_per_row * total <= self.memory_limit:
+            tile_height = max(1, total)
+            max_tiles = 1
+        else:
+            tile_height = self.CONTENT_TILE_HEIGHT
+            max_tiles = max(self.memory_limit // (bytes_per_row * tile_height), view.height // tile_height + 2)
+            
+        top = origin + self.scroll_y
+        tile_index = top // tile_height
+        while tile_index * tile_height < min(top + view.height, total):
+            tile_top = tile_index * tile_height
+            tile = self.content_tiles.get(tile_index)
+            if tile is None:
+                tile = pygame.Surface((width, tile_height))
+                tile.fill(self.color)
+                index, message_top = self.find_message(tile_top - origin)
+                tile.blits(self.line_blits(index, message_top + origin - tile_top, 0, tile_height, 0),
+                           doreturn=False)
+                self.content_tiles[tile_index] = tile
+                if len(self.content_tiles) > max_tiles:
+                    self.content_tiles.popitem(last=False)  # Evict the least recently used
+            else:
+                self.content_tiles.move_to_end(tile_index)
+                
+            # Only the rows of the tile that are in view
+            area = pygame.Rect(0, max(0, top - tile_top), width, view.height)
+            surface.blit(tile, (view.left, view.top + tile_top + area.top - top), area)
+            tile_index += 1
+    
+    def draw_state(self):
+        """Everything that affects how the panel looks"""
+        return super().draw_state() + (self.title, self.version, len(self.messages), self.anchor, self.scroll_y)
+    
+    def render(self, surface):
         # Draw the panel background and border
-        super().draw(surface)
+        super().render(surface)
+        rect = pygame.Rect(0, 0, self.rect.width, self.rect.height)
         
         # Draw title if provided
-        y_offset = self.padding
         if self.title:
             title_surf = self.title_font.render(self.title, True, self.text_color)
-            title_rect = title_surf.get_rect(midtop=(self.rect.centerx, self.rect.top + self.padding))
+            title_rect = title_surf.get_rect(midtop=(rect.centerx, rect.top + self.padding))
             surface.blit(title_surf, title_rect)
-            y_offset = title_rect.bottom + self.line_spacing * 2
         
-        # Draw messages with word wrapping
-        visible_messages = self.messages[self.scroll_offset:self.scroll_offset + self.max_visible_lines]
-        for message in visible_messages:
-            # Simple word wrap - split by newlines first
-            for line in message.split('\n'):
-                # Check if line needs wrapping
-                words = line.split()
-                if not words:
-                    y_offset += self.font.get_height() + self.line_spacing
-                    continue
-                    
-                current_line = words[0]
-                for word in words[1:]:
-                    # Test if adding this word exceeds the width
-                    test_line = current_line + " " + word
-                    width = self.font.render(test_line, True, self.text_color).get_width()
-                    
-                    if width < self.rect.width - 2 * self.padding:
-                        current_line = test_line  # Word fits, add it
-                    else:
-                        # Render current line and start new line
-                        text_surf = self.font.render(current_line, True, self.text_color)
-                        text_rect = text_surf.get_rect(left=self.rect.left + self.padding, top=y_offset)
-                        surface.blit(text_surf, text_rect)
-                        
-                        y_offset += text_surf.get_height() + self.line_spacing
-                        current_line = word
-                
-                # Render the last line
-                if current_line:
-                    text_surf = self.font.render(current_line, True, self.text_color)
-                    text_rect = text_surf.get_rect(left=self.rect.left + self.padding, top=y_offset)
-                    surface.blit(text_surf, text_rect)
-                    y_offset += text_surf.get_height() + self.line_spacing
+        # Measure just far enough to fill the view, then draw only the messages in it
+        self.check_wrap_width()
+        view = self.content_rect()
+        at_bottom = self.measure_down(self.scroll_y + view.height)
+        at_top = self.measure_up(self.scroll_y)
             
-            # Add extra spacing between messages
-            y_offset += self.line_spacing
+        # Lines cut by the top or bottom of the view are clipped to it
+        surface.set_clip(pygame.Rect(rect.left, view.top, rect.width, view.height))
+        if self.prerender:
+            self.blit_content(surface, view)
+        else:
+            index, top = self.find_message(self.scroll_y)
+            surface.blits(self.line_blits(index, view.top + top - self.scroll_y, view.top, view.bottom, view.left),
+                          doreturn=False)
+        surface.set_clip(None)
             
         # Draw scroll indicators if needed
-        if len(self.messages) > self.max_visible_lines:
-            if self.scroll_offset > 0:
-                # Draw up arrow
-                pygame.draw.polygon(surface, (50, 50, 50), [
-                    (self.rect.right - 20, self.rect.top + 15),
-                    (self.rect.right - 10, self.rect.top + 5),
-                    (self.rect.right - 30, self.rect.top + 5)
-                ])
+        if not at_top or self.scroll_y > -(self.depths[-1] if self.depths else 0):
+            # Draw up arrow
+            pygame.draw.polygon(surface, (50, 50, 50), [
+                (rect.right - 20, rect.top + 15),
+                (rect.right - 10, rect.top + 5),
+                (rect.right - 30, rect.top + 5)
+            ])
             
-            if self.scroll_offset + self.max_visible_lines < len(self.messages):
-                # Draw down arrow
-                pygame.draw.polygon(surface, (50, 50, 50), [
-                    (self.rect.right - 20, self.rect.bottom - 15),
-                    (self.rect.right - 10, self.rect.bottom - 5),
-                    (self.rect.right - 30, self.rect.bottom - 5)
-                ])
+        if not at_bottom or self.scroll_y + view.height < self.tops[-1]:
+            # Draw down arrow
+            pygame.draw.polygon(surface, (50, 50, 50), [
+                (rect.right - 20, rect.bottom - 15),
+                (rect.right - 10, rect.bottom - 5),
+                (rect.right - 30, rect.bottom - 5)
+            ])
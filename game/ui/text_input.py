@@ -1,12 +1,46 @@
+import bisect
 import pygame
+from .widget import Widget
+from ..text_cache import cached_font, uncached_font
 
-class TextInput:
+class PrefixWidths:
+    """Pixel widths of every prefix of a text, measured only when first needed.
+    
+    Item i is font.size(text[:i])[0]. An edit only forgets the widths of the
+    prefixes after it, so typing at the end measures one new prefix, and
+    bisect over the items measures just the few prefixes it probes.
+    """
+    
+    def __init__(self, font):
+        self.font = font
+        self.text = ""
+        self.widths = [0]  # None where not measured yet
+    
+    def __len__(self):
+        return len(self.widths)
+    
+    def __getitem__(self, index):
+        width = self.widths[index]
+        if width is None:
+            width = self.widths[index] = self.font.size(self.text[:index])[0]
+        return width
+    
+    def update(self, text, start):
+        """Follow an edit that left the first start characters unchanged"""
+        start = min(start, len(self.text), len(text))
+        self.text = text
+        del self.widths[start + 1:]
+        self.widths.extend([None] * (len(text) - start))
+
+class TextInput(Widget):
     """Text input field with Minecraft-inspired styling"""
     
     def __init__(self, x, y, width, height, font, placeholder="Type here...", 
                  max_length=100, border_color=(30, 30, 30), bg_color=(220, 220, 220)):
         self.rect = pygame.Rect(x, y, width, height)
-        self.font = font
+        self.font = cached_font(font)
+        # The text being edited changes with every keystroke, so it skips the shared cache
+        self.text_font = uncached_font(font)
         self.text = ""
         self.placeholder = placeholder
         self.max_length = max_length
@@ -22,41 +56,56 @@ class TextInput:
         self.text_offset = 0
         self.visible_width = width - 20  # Padding
     
+        # Cursor positions in pixels, kept up to date as the text is edited
+        self.prefix_widths = PrefixWidths(self.font)
+    
     def draw(self, surface):
+        # Scroll before checking the cached look, since the offset is part of it
+        self.scroll_to_cursor()
+        super().draw(surface)
+    
+    def scroll_to_cursor(self):
+        """Adjust the text offset so the cursor stays visible in long text"""
+        if not self.text or self.prefix_width(len(self.text)) <= self.visible_width:
+            return
+            
+        # Calculate cursor position in pixels
+        cursor_pos_pixels = self.prefix_width(self.cursor_pos)
+        
+        # Adjust offset to keep cursor visible
+        if cursor_pos_pixels - self.text_offset > self.visible_width:
+            self.text_offset = cursor_pos_pixels - self.visible_width + 10
+        elif cursor_pos_pixels < self.text_offset:
+            self.text_offset = max(0, cursor_pos_pixels - 10)
+    
+    def render(self, surface):
+        # Drawn relative to the cached surface, which includes the 2px border
+        rect = pygame.Rect(2, 2, self.rect.width, self.rect.height)
+        
         # Draw border with 3D effect (Minecraft style)
-        border_rect = pygame.Rect(self.rect.x - 2, self.rect.y - 2, 
-                                 self.rect.width + 4, self.rect.height + 4)
+        border_rect = pygame.Rect(rect.x - 2, rect.y - 2, 
+                                 rect.width + 4, rect.height + 4)
         pygame.draw.rect(surface, (0, 0, 0), border_rect)  # Outer border
         
         # Draw inset effect if active
         if self.active:
-            inset_rect = pygame.Rect(self.rect.x - 1, self.rect.y - 1, 
-                                    self.rect.width + 2, self.rect.height + 2)
+            inset_rect = pygame.Rect(rect.x - 1, rect.y - 1, 
+                                    rect.width + 2, rect.height + 2)
             pygame.draw.rect(surface, (100, 100, 255), inset_rect)  # Highlight color
         
         # Draw main background
-        pygame.draw.rect(surface, self.bg_color, self.rect)  # Background
+        pygame.draw.rect(surface, self.bg_color, rect)  # Background
         
         # Draw text or placeholder
         if self.text:
-            text_surf = self.font.render(self.text, True, (0, 0, 0))
+            text_surf = self.text_font.render(self.text, True, (0, 0, 0))
             
             # Handle text scrolling if too long
             text_width = text_surf.get_width()
             if text_width > self.visible_width:
-                # Calculate cursor position in pixels
-                cursor_text = self.text[:self.cursor_pos]
-                cursor_pos_pixels = self.font.render(cursor_text, True, (0, 0, 0)).get_width()
-                
-                # Adjust offset to keep cursor visible
-                if cursor_pos_pixels - self.text_offset > self.visible_width:
-                    self.text_offset = cursor_pos_pixels - self.visible_width + 10
-                elif cursor_pos_pixels < self.text_offset:
-                    self.text_offset = max(0, cursor_pos_pixels - 10)
-                
                 # Create a subsurface for clipping
-                text_rect = pygame.Rect(self.rect.x + 5, self.rect.y + 5, 
-                                       self.visible_width, self.rect.height - 10)
+                text_rect = pygame.Rect(rect.x + 5, rect.y + 5, 
+                                       self.visible_width, rect.height - 10)
                 
                 # Use clipping to only show visible portion
                 old_clip = surface.get_clip()
@@ -65,26 +114,25 @@ class TextInput:
                 surface.set_clip(old_clip)
             else:
                 # Text fits, no scrolling needed
-                surface.blit(text_surf, (self.rect.x + 5, self.rect.y + 5))
+                surface.blit(text_surf, (rect.x + 5, rect.y + 5))
             
             # Draw cursor if active and visible
             if self.active and self.cursor_visible:
-                cursor_text = self.text[:self.cursor_pos]
-                cursor_x = self.rect.x + 5 + self.font.render(cursor_text, True, (0, 0, 0)).get_width() - self.text_offset
+                cursor_x = rect.x + 5 + self.prefix_width(self.cursor_pos) - self.text_offset
                 
                 # Only draw cursor if it's in the visible area
-                if cursor_x >= self.rect.x and cursor_x <= self.rect.x + self.rect.width:
+                if cursor_x >= rect.x and cursor_x <= rect.x + rect.width:
                     pygame.draw.line(surface, (0, 0, 0), 
-                                    (cursor_x, self.rect.y + 5), 
-                                    (cursor_x, self.rect.y + self.rect.height - 5), 2)
+                                    (cursor_x, rect.y + 5), 
+                                    (cursor_x, rect.y + rect.height - 5), 2)
         else:
             # Draw placeholder text
             placeholder_surf = self.font.render(self.placeholder, True, (100, 100, 100))
-            surface.blit(placeholder_surf, (self.rect.x + 5, self.rect.y + 5))
+            surface.blit(placeholder_surf, (rect.x + 5, rect.y + 5))
     
-    def update(self, events):
-        # Handle cursor blinking
-        self.cursor_timer += pygame.time.get_ticks() % 60  # Add time since last frame
+    def update(self, events, dt=0):
+        # Handle cursor blinking (dt is the milliseconds since the last frame)
+        self.cursor_timer += dt
         if self.cursor_timer >= self.cursor_blink_speed:
             self.cursor_visible = not self.cursor_visible
             self.cursor_timer = 0
@@ -97,17 +145,7 @@ class TextInput:
                     self.active = True
                     # Set cursor position based on click position
                     click_x = event.pos[0] - self.rect.x - 5 + self.text_offset
-                    self.cursor_pos = len(self.text)
-                    
-                    # Find best cursor position based on click
-                    if self.text:
-                        best_dist = float('inf')
-                        for i in range(len(self.text) + 1):
-                            text_width = self.font.render(self.text[:i], True, (0, 0, 0)).get_width()
-                            dist = abs(text_width - click_x)
-                            if dist < best_dist:
-                                best_dist = dist
-                                self.cursor_pos = i
+                    self.cursor_pos = self.index_at(click_x)
                 else:
                     self.active = False
             
@@ -136,11 +174,13 @@ class TextInput:
                     if self.cursor_pos > 0:
                         self.text = self.text[:self.cursor_pos-1] + self.text[self.cursor_pos:]
                         self.cursor_pos -= 1
+                        self.prefix_widths.update(self.text, self.cursor_pos)
                         self.cursor_visible = True
                         self.cursor_timer = 0
                 elif event.key == pygame.K_DELETE:
                     if self.cursor_pos < len(self.text):
                         self.text = self.text[:self.cursor_pos] + self.text[self.cursor_pos+1:]
+                        self.prefix_widths.update(self.text, self.cursor_pos)
                         self.cursor_visible = True
                         self.cursor_timer = 0
                 
@@ -149,12 +189,46 @@ class TextInput:
                     # Filter out control characters
                     if ord(event.unicode) >= 32:
                         self.text = self.text[:self.cursor_pos] + event.unicode + self.text[self.cursor_pos:]
+                        self.prefix_widths.update(self.text, self.cursor_pos)
                         self.cursor_pos += 1
                         self.cursor_visible = True
                         self.cursor_timer = 0
         
         return self.text
     
+    def prefix_width(self, index):
+        """Width in pixels of the first index characters of the text"""
+        if self.prefix_widths.text is not self.text:
+            # Text replaced as a whole (set_text, clear) rather than edited
+            self.prefix_widths.update(self.text, 0)
+        return self.prefix_widths[index]
+    
+    def index_at(self, x):
+        """Cursor position nearest to x pixels into the text, found by bisect"""
+        self.prefix_width(0)
+        widths = self.prefix_widths
+        index = bisect.bisect_left(widths, x)
+        if index >= len(widths):
+            return len(self.text)
+        if index > 0 and x - widths[index - 1] <= widths[index] - x:
+            return index - 1
+        return index
+    
+    def draw_state(self):
+        """Everything that affects how the input looks"""
+        return (tuple(self.rect), self.text, self.placeholder, self.active, self.cursor_pos,
+                self.active and self.cursor_visible, self.text_offset)
+    
+    def draw_rect(self):
+        """Screen area the input draws into, including its border"""
+        return self.rect.inflate(4, 4)
+    
+    def time_to_blink(self):
+        """Milliseconds until the cursor next blinks, or None when inactive"""
+        if not self.active:
+            return None
+        return max(0, self.cursor_blink_speed - self.cursor_timer)
+    
     def get_text(self):
         return self.text
     
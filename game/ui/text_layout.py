@@ -0,0 +1,30 @@
+def wrap_message(font, message, max_width):
+    """Break a message into lines narrower than max_width, as (text, height) pairs.
+    
+    The message is split on newlines, then each line at word breaks. Each
+    break is found by binary search over how many of the remaining words
+    fit, measured with font.size, so no text is rendered. A word wider
+    than max_width gets a line of its own, and a blank line keeps the
+    font's height.
+    """
+    lines = []
+    for paragraph in message.split('\n'):
+        words = paragraph.split()
+        if not words:
+            lines.append(("", font.get_height()))
+            continue
+            
+        start = 0
+        while start < len(words):
+            # Most words from start that still fit (always at least one)
+            low, high = start + 1, len(words)
+            while low < high:
+                middle = (low + high + 1) // 2
+                if font.size(" ".join(words[start:middle]))[0] < max_width:
+                    low = middle
+                else:
+                    high = middle - 1
+            text = " ".join(words[start:low])
+            lines.append((text, font.size(text)[1]))
+            start = low
+    return lines
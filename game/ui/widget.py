@@ -0,0 +1,41 @@
+import pygame
+
+class Widget:
+    """Base for UI widgets that keep their rendered look in a cached surface.
+    
+    Subclasses describe everything that affects how they look in
+    draw_state(), the screen area they cover in draw_rect(), and draw
+    themselves into a surface of that size in render(). draw() only
+    re-renders when draw_state() changes; otherwise it is a single blit.
+    """
+    
+    COLORKEY = (255, 0, 255)  # Marks pixels render() leaves untouched
+    
+    cached_state = None
+    cached_surface = None
+    render_count = 0
+    
+    def draw(self, surface):
+        """Blit the cached look, re-rendering it first if the state changed"""
+        state = self.draw_state()
+        if self.cached_surface is None or state != self.cached_state:
+            layer = self.new_surface()
+            self.render(layer)
+            if layer.get_colorkey():
+                # RLE-encode only once drawn: text blends differently onto an RLE surface
+                layer.set_colorkey(layer.get_colorkey(), pygame.RLEACCEL)
+            self.cached_surface = layer
+            self.cached_state = state
+            self.render_count += 1
+        surface.blit(self.cached_surface, self.draw_rect())
+    
+    def new_surface(self):
+        """A blank surface covering draw_rect(), transparent wherever render() doesn't draw"""
+        layer = pygame.Surface(self.draw_rect().size)
+        layer.fill(self.COLORKEY)
+        layer.set_colorkey(self.COLORKEY)
+        return layer
+    
+    def invalidate(self):
+        """Re-render on the next draw even if the state looks unchanged"""
+        self.cached_surface = None
@@ -4,7 +4,51 @@ import sys
 import pygame
 from game.game_manager import GameManager
 
+def run(game, screen, idle_wait=True, duration=None):
+    """Run the game loop until the window is closed (or for duration ms).
+    
+    With idle_wait, the loop stops drawing while the current scene has
+    nothing animating and sleeps in pygame.event.wait until input arrives
+    or the scene's next timed change (like a cursor blink) is due.
+    """
+    clock = pygame.time.Clock()
+    start = pygame.time.get_ticks()
+    
+    while duration is None or pygame.time.get_ticks() - start < duration:
+        # Milliseconds since the last frame (also caps the frame rate)
+        dt = clock.tick(60)
+        events = pygame.event.get()
+        
+        # Nothing is moving: sleep until input or the scene's next change
+        timeout = game.idle_timeout() if idle_wait else 0
+        if timeout and not events:
+            events = [pygame.event.wait(timeout)]
+            dt += clock.tick()  # Include the time spent waiting
+            events += pygame.event.get()
+        
+        # Process events
+        for event in events:
+            if event.type == pygame.QUIT:
+                return
+            elif event.type != pygame.NOEVENT:  # A wait that timed out
+                game.handle_event(event)
+        
+        # Update game state
+        game.update(dt)
+        
+        # Draw everything
+        screen.fill((62, 88, 156))  # Sky blue background
+        game.draw()
+        
+        # Push only the areas that changed to the display
+        rects = game.dirty_rects()
+        if rects is None:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
+
 def main():
+    game = None
     try:
         # Initialize pygame
         pygame.init()
@@ -28,31 +72,12 @@ def main():
         # except (FileNotFoundError, pygame.error):
         #     print("Warning: Could not load icon file.")
         
-        # Create game manager
-        game = GameManager(screen)
+        # Create game manager (run with --sqlite to keep the save in SQLite)
+        backend = 'sqlite' if '--sqlite' in sys.argv[1:] else 'json'
+        game = GameManager(screen, backend=backend)
         
         # Main game loop
-        running = True
-        clock = pygame.time.Clock()
-        
-        while running:
-            # Process events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                else:
-                    game.handle_event(event)
-            
-            # Update game state
-            game.update()
-            
-            # Draw everything
-            screen.fill((62, 88, 156))  # Sky blue background
-            game.draw()
-            pygame.display.flip()
-            
-            # Cap the frame rate
-            clock.tick(60)
+        run(game, screen)
         
         # Clean up
         pygame.quit()
@@ -64,6 +89,8 @@ def main():
     finally:
         # Make sure we always clean up
         try:
+            if game:
+                game.shutdown()  # Flush pending saves
             pygame.quit()
         except:
             pass
@@ -0,0 +1,5 @@
+import os
+
+# Fonts and surfaces only; no window or sound card needed
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
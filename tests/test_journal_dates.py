@@ -0,0 +1,39 @@
+import datetime
+from game.journal_dates import JournalDateIndex, day_start
+from game.journal_entry import JournalEntry
+from game.sqlite_store import SQLiteStore
+
+def make_entries():
+    """Entries a few hours apart over about two weeks, with gaps and one out of order"""
+    start = day_start(datetime.date(2024, 2, 25).toordinal())
+    entries = [JournalEntry(start + hours * 3600, f"entry {hours}")
+               for hours in range(0, 14 * 24, 7) if hours // 24 not in (3, 4, 9)]
+    entries.append(JournalEntry(start + 4 * 24 * 3600 + 600, "late entry"))
+    return entries
+
+def test_sqlite_dates_match_in_memory_index(tmp_path):
+    entries = make_entries()
+    expected = JournalDateIndex()
+    expected.update(entries)
+    
+    store = SQLiteStore(str(tmp_path / 'player_data.db'))
+    store.extend_journal(entries)
+    dates = store.journal_dates()
+    
+    first_day = datetime.date(2024, 2, 20).toordinal()
+    for day in range(first_day, first_day + 25):
+        assert dates.count_between(day, day + 1) == expected.count_between(day, day + 1)
+        assert dates.count_between(first_day, day) == expected.count_between(first_day, day)
+        assert dates.first_position(day) == expected.first_position(day)
+        assert dates.next_day(day) == expected.next_day(day)
+        assert dates.previous_day(day) == expected.previous_day(day)
+    store.close()
+
+def test_empty_sqlite_journal_has_no_dates(tmp_path):
+    store = SQLiteStore(str(tmp_path / 'player_data.db'))
+    dates = store.journal_dates()
+    today = datetime.date.today().toordinal()
+    assert dates.count_between(today, today + 1) == 0
+    assert dates.first_position(today) is None
+    assert dates.next_day(today) is None and dates.previous_day(today) is None
+    store.close()
@@ -0,0 +1,47 @@
+from game.journal_entry import JournalEntry
+from game.journal_log import JournalLog
+
+def make_log(tmp_path):
+    return JournalLog(str(tmp_path / 'journal.jsonl'), str(tmp_path / 'journal.idx'))
+
+def entries(count):
+    return [JournalEntry(1700000000 + i * 60, f"entry {i}") for i in range(count)]
+
+def test_truncated_tail_is_dropped(tmp_path):
+    log = make_log(tmp_path)
+    log.extend(entries(3))
+    
+    # A crash partway through appending the fourth record
+    with open(log.log_file, 'ab') as f:
+        f.write(b'{"ts":1700000300,"te')
+        
+    log = make_log(tmp_path)
+    assert len(log) == 3
+    assert log.read_all() == entries(3)
+    
+    # Appends continue cleanly after the recovered tail
+    log.append(JournalEntry(1700000400, "after"))
+    assert make_log(tmp_path).read(-1) == JournalEntry(1700000400, "after")
+
+def test_index_rebuilt_when_behind_log(tmp_path):
+    log = make_log(tmp_path)
+    log.extend(entries(5))
+    
+    # The log append landed but the index append did not
+    with open(log.index_file, 'r+b') as f:
+        f.truncate(2 * JournalLog.OFFSET_SIZE)
+        
+    log = make_log(tmp_path)
+    assert len(log) == 5
+    assert log.read_range(0, 5) == entries(5)
+
+def test_append_while_loading_in_background(tmp_path):
+    make_log(tmp_path).extend(entries(2000))
+    
+    log = make_log(tmp_path)
+    log.load_in_background()
+    log.append(JournalEntry(1800000000, "new"))
+    
+    loaded = log.entries()
+    assert len(loaded) == len(log) == 2001
+    assert loaded[-1].text == "new"
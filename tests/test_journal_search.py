@@ -0,0 +1,42 @@
+from game.journal_entry import JournalEntry
+from game.journal_search import TrigramIndex
+from game.player_data import PlayerData
+from game.sqlite_store import SQLiteStore
+
+def open_player(tmp_path):
+    return PlayerData(store=SQLiteStore(str(tmp_path / 'player_data.db')))
+
+def wait_for_index(player):
+    builder = player.journal_index._builder
+    if builder is not None:
+        builder.join()
+
+def test_sqlite_journal_indexed_in_background(tmp_path):
+    store = SQLiteStore(str(tmp_path / 'player_data.db'))
+    store.extend_journal([JournalEntry(1700000000 + i, f"entry {i} watered") for i in range(50)])
+    store.close()
+
+    player = open_player(tmp_path)
+    player.prepare_journal_search()
+    wait_for_index(player)
+    assert player.journal_index.size == 50
+    assert len(player.search_journal("watered")) == 50
+
+    # Entries saved after the build are indexed as they are added
+    player.add_journal_entry("read about trees")
+    assert player.journal_index.size == 51
+    assert [entry.text for entry in player.search_journal("trees")] == ["read about trees"]
+    player.close()
+
+def test_search_matches_a_full_scan():
+    words = "water plant sun code garden leaves".split()
+    entries = [JournalEntry(1700000000 + i, " ".join(words[(i * 7 + k * 3) % 6] for k in range(i % 5 + 2)))
+               for i in range(3000)]
+    index = TrigramIndex()
+    index.INTERSECT_CHUNK = 64  # Several chunks per query
+    index.update(entries[:2500])  # The rest is not indexed yet
+    
+    for query in ("plant sun", "Sun Code", "water plant sun code", "den lea", "xyz", "sun"):
+        expected = [entry for entry in reversed(entries) if query.lower() in entry.text.lower()]
+        assert index.search(query, entries, limit=10000) == expected
+        assert index.search(query, entries, limit=50) == expected[:50]
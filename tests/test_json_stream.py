@@ -0,0 +1,24 @@
+import io
+import json
+import pytest
+from game.json_stream import load_object_streaming
+
+DOCUMENT = {
+    'f': 0.5,
+    'e': 1e5,
+    'n': -12.25e-3,
+    'i': 10,
+    'journal_entries': [{'text': "a", 'ts': 1700000000}, 2.5, -3, 4e10],
+    'unlocked_messages': ["hello", "world"],
+}
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 65536])
+def test_round_trip_with_small_chunks(chunk_size):
+    for separators in ((',', ':'), (', ', ': ')):
+        items = []
+        text = json.dumps(DOCUMENT, separators=separators)
+        data = load_object_streaming(io.StringIO(text), 'journal_entries', items.append, chunk_size)
+        
+        expected = dict(DOCUMENT)
+        assert items == expected.pop('journal_entries')
+        assert data == expected
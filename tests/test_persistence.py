@@ -0,0 +1,115 @@
+import os
+import threading
+import pytest
+from game.journal_entry import JournalEntry
+from game.journal_log import JournalLog
+from game.persistence import PersistenceEngine
+from game.save_format import SaveFormatError
+from game.save_writer import SaveWriter
+
+STATE = {
+    'plant_level': 2,
+    'plant_growth': 0.0,
+    'watered_today': False,
+    'affirmation_done_today': False,
+    'unlocked_messages': ["hello"],
+    'last_login': "2024-01-01",
+}
+
+def open_engine(tmp_path, writer):
+    return PersistenceEngine(str(tmp_path / 'save.sav'), str(tmp_path / 'save.wal'), writer)
+
+def apply(state, ops):
+    """Growth after replaying ops on top of state"""
+    return round(state['plant_growth'] + sum(op.get('growth', 0.0) for op in ops), 6)
+
+def write_save(tmp_path, snapshots):
+    """Log three ops after each snapshot; returns the final expected growth"""
+    writer = SaveWriter(coalesce_delay=0)
+    engine = open_engine(tmp_path, writer)
+    engine.load()
+    state = dict(STATE)
+    for _ in range(snapshots):
+        for _ in range(3):
+            engine.append({'op': 'growth', 'growth': 0.1})
+            state['plant_growth'] = round(state['plant_growth'] + 0.1, 6)
+        engine.snapshot(state)
+        writer.flush()
+    # Ops after the last snapshot only live in the WAL
+    for _ in range(2):
+        engine.append({'op': 'growth', 'growth': 0.1})
+    engine.close()
+    writer.close()
+    return round(state['plant_growth'] + 0.2, 6)
+
+def test_wal_replayed_on_top_of_snapshot(tmp_path):
+    expected = write_save(tmp_path, snapshots=2)
+    
+    engine = open_engine(tmp_path, None)
+    snapshot, ops = engine.load()
+    assert snapshot['seq'] == 6
+    assert [op['seq'] for op in ops] == [7, 8]
+    assert apply(snapshot, ops) == expected
+
+def test_corrupt_snapshot_falls_back_to_backup(tmp_path):
+    expected = write_save(tmp_path, snapshots=2)
+    with open(tmp_path / 'save.sav', 'r+b') as f:
+        f.truncate(10)
+        
+    engine = open_engine(tmp_path, None)
+    snapshot, ops = engine.load()
+    assert snapshot['seq'] == 3
+    assert apply(snapshot, ops) == expected
+
+def test_unreadable_save_raises(tmp_path):
+    write_save(tmp_path, snapshots=2)
+    for name in ('save.sav', 'save.sav.bak'):
+        with open(tmp_path / name, 'wb') as f:
+            f.write(b'garbage')
+            
+    with pytest.raises(SaveFormatError):
+        open_engine(tmp_path, None).load()
+
+def test_torn_wal_record_is_cut_before_appending(tmp_path):
+    writer = SaveWriter(coalesce_delay=0)
+    engine = open_engine(tmp_path, writer)
+    engine.load()
+    for _ in range(3):
+        engine.append({'op': 'growth', 'growth': 0.1})
+    engine.close()
+    with open(tmp_path / 'save.wal', 'ab') as f:
+        f.write(b'{"op":"growth","gro')
+        
+    # Ops logged after the crash must not be merged onto the torn record
+    engine = open_engine(tmp_path, writer)
+    assert len(engine.load()[1]) == 3
+    for _ in range(5):
+        engine.append({'op': 'growth', 'growth': 0.1})
+    engine.close()
+    writer.close()
+    
+    snapshot, ops = open_engine(tmp_path, None).load()
+    assert [op['seq'] for op in ops] == list(range(1, 9))
+
+def test_appends_are_synced_once_per_burst_on_the_writer(tmp_path, monkeypatch):
+    synced = []
+    fsync = os.fsync
+    def record_fsync(fd):
+        synced.append(threading.current_thread().name)
+        fsync(fd)
+    monkeypatch.setattr(os, 'fsync', record_fsync)
+    
+    # A long coalesce delay keeps the burst together until flush()
+    writer = SaveWriter(coalesce_delay=10)
+    engine = open_engine(tmp_path, writer)
+    engine.load()
+    log = JournalLog(str(tmp_path / 'journal.jsonl'), str(tmp_path / 'journal.idx'), writer)
+    for i in range(5):
+        engine.append({'op': 'journal', 'growth': 0.1})
+        log.append(JournalEntry(1700000000 + i, f"entry {i}"))
+    writer.flush()
+    
+    # One fsync each for the WAL, the journal log and its index
+    assert synced == ['SaveWriter'] * 3
+    engine.close()
+    writer.close()
@@ -0,0 +1,37 @@
+import pytest
+from game.journal_entry import parse_date
+from game.save_format import SCHEMA_VERSION, SaveFormatError, decode_save, encode_save, migrate
+
+SAVE = {
+    'plant_level': 4,
+    'plant_growth': 0.35,
+    'watered_today': True,
+    'affirmation_done_today': False,
+    'unlocked_messages': ["first", "zweite Nachricht ✓"],
+    'last_login': "2024-05-01",
+    'seq': 42,
+    'journal_entries': [{'ts': 1714580000, 'text': "hello"}, {'ts': 1714590000, 'text': ""}],
+}
+
+def test_round_trip():
+    assert decode_save(encode_save(SAVE)) == SAVE
+
+def test_truncated_save_is_rejected():
+    payload = encode_save(SAVE)
+    with pytest.raises(SaveFormatError):
+        decode_save(payload[:-3])
+
+def test_newer_version_is_rejected():
+    payload = bytearray(encode_save(SAVE))
+    payload[4:6] = (SCHEMA_VERSION + 1).to_bytes(2, 'little')
+    with pytest.raises(SaveFormatError):
+        decode_save(bytes(payload))
+
+def test_json_save_migrates_to_current_version():
+    legacy = dict(SAVE, journal_entries=[{'date': "2024-05-01 18:30", 'text': "hi"}])
+    del legacy['seq']
+    
+    data = migrate(legacy, 0)
+    assert data['seq'] == 0
+    assert data['journal_entries'] == [{'ts': parse_date("2024-05-01 18:30"), 'text': "hi"}]
+    assert decode_save(encode_save(data)) == data
@@ -0,0 +1,45 @@
+import random
+import pygame
+import pytest
+from game.ui.text_input import TextInput
+
+@pytest.fixture(scope='module')
+def font():
+    pygame.font.init()
+    yield pygame.font.Font(None, 24)
+    pygame.font.quit()
+
+def random_text(rng, words=40):
+    vocabulary = ["a", "plant", "grows", "slowly", "supercalifragilistic", "ok", "\n", "every", "day"]
+    return " ".join(rng.choice(vocabulary) for _ in range(rng.randint(0, words)))
+
+def nearest_index(font, text, x):
+    """Reference index_at: the prefix whose width is closest to x, earliest on ties"""
+    widths = [font.size(text[:i])[0] for i in range(len(text) + 1)]
+    return min(range(len(widths)), key=lambda i: (abs(widths[i] - x), i))
+
+def test_index_at_matches_nearest_prefix(font):
+    rng = random.Random(3)
+    text_input = TextInput(0, 0, 300, 40, font)
+    for _ in range(50):
+        text = random_text(rng, 12).replace("\n", "")
+        text_input.set_text(text)
+        full_width = font.size(text)[0]
+        for x in [-5, 0, full_width, full_width + 20] + [rng.randint(0, full_width) for _ in range(10)]:
+            assert text_input.index_at(x) == nearest_index(font, text, x)
+
+def test_prefix_widths_follow_edits(font):
+    rng = random.Random(11)
+    text_input = TextInput(0, 0, 300, 40, font)
+    text = ""
+    for _ in range(200):
+        position = rng.randint(0, len(text))
+        if text and rng.random() < 0.3:
+            text = text[:position - 1] + text[position:] if position else text[1:]
+            position = max(0, position - 1)
+        else:
+            text = text[:position] + rng.choice("abc W.") + text[position:]
+        text_input.text = text
+        text_input.prefix_widths.update(text, position)
+        index = rng.randint(0, len(text))
+        assert text_input.prefix_width(index) == font.size(text[:index])[0]
@@ -0,0 +1,42 @@
+import random
+import pygame
+import pytest
+from game.ui.text_layout import wrap_message
+
+@pytest.fixture(scope='module')
+def font():
+    pygame.font.init()
+    yield pygame.font.Font(None, 24)
+    pygame.font.quit()
+
+def random_text(rng, words=40):
+    vocabulary = ["a", "plant", "grows", "slowly", "supercalifragilistic", "ok", "\n", "every", "day"]
+    return " ".join(rng.choice(vocabulary) for _ in range(rng.randint(0, words)))
+
+def greedy_wrap(font, message, max_width):
+    """Reference wrap: add words one at a time while the line still fits"""
+    lines = []
+    for paragraph in message.split('\n'):
+        words = paragraph.split()
+        if not words:
+            lines.append("")
+            continue
+        line = words[0]
+        for word in words[1:]:
+            if font.size(line + " " + word)[0] < max_width:
+                line += " " + word
+            else:
+                lines.append(line)
+                line = word
+        lines.append(line)
+    return lines
+
+def test_wrap_message_matches_greedy_wrap(font):
+    rng = random.Random(7)
+    for _ in range(200):
+        message = random_text(rng)
+        max_width = rng.randint(20, 400)
+        wrapped = wrap_message(font, message, max_width)
+        assert [text for text, _ in wrapped] == greedy_wrap(font, message, max_width)
+        assert all(height == (font.size(text)[1] if text else font.get_height())
+                   for text, height in wrapped)